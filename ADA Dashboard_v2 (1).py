@@ -745,12 +745,17 @@ def main():
 
     # Initialize dictionaries to store start and stop indices for each target value
     target_indices = {value: {"start": None, "stop": None} for value in target_values.values()}
-    # Find row numbers for each target value and update dictionaries with start and stop indices
-    for target_value, dict_name in target_values.items():
-        rows = find_row_with_value(df, target_value)
-        start, stop = find_start_stop_indices(rows)
-        target_indices[dict_name]["start"] = start
-        target_indices[dict_name]["stop"] = stop
+    # Match every target value in one pass over the column: a dict lookup per
+    # cell tests all programs at once, instead of re-scanning the whole column
+    # with find_row_with_value for each program
+    for index, value in enumerate(df.iloc[:, 1], start=1):
+        dict_name = target_values.get(value)
+        if dict_name is None:
+            continue
+        indices = target_indices[dict_name]
+        if indices["start"] is None:
+            indices["start"] = index
+        indices["stop"] = index
 
     prog_c_start = target_indices["Prog_C_TK"]["start"]
     prog_c_tk_stop = target_indices["Prog_N"]["start"]
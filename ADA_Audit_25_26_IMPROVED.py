@@ -1,13 +1,110 @@
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
 import openpyxl
-from tqdm import tqdm
-import time
+
+# Optional Rust-backed Excel reader - much faster than openpyxl for large files
+try:
+    import python_calamine  # noqa: F401
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+# Rightmost column any consumer reads: the audit pipeline stops at AJ
+# (index 35), the dashboard reads up to index 47. Columns beyond this are
+# never materialized by the loader.
+LAST_USED_COLUMN = 47
 
 
 # =============================================================================
 # UTILITY FUNCTIONS FOR SEARCHING AND PROCESSING DATA
 # =============================================================================
 
+def load_student_attendance_data(excel_file_path):
+    """
+    Loads the attendance workbook into a DataFrame using openpyxl's read-only mode.
+
+    What this does:
+    - Uses the python-calamine engine (Rust-backed, fastest option) when the
+      optional python_calamine package is installed
+    - Otherwise opens the Excel file in read-only, values-only mode so openpyxl
+      streams rows instead of building the full workbook in memory
+    - Iterates rows with iter_rows(values_only=True), which skips creating
+      Cell objects entirely (much faster on large workbooks)
+    - Keeps a pickled sidecar cache next to the workbook keyed by the file's
+      mtime and size, so reloading the same unchanged file skips the Excel
+      parse entirely
+    - Returns the rows as a DataFrame shaped like pd.read_excel(header=None)
+
+    Parameters:
+    - excel_file_path: Full path to the attendance Excel file
+
+    Returns:
+    - A DataFrame with one column per spreadsheet column and no header row
+    """
+    # Pickle (not Feather/Arrow) because the sheet's columns mix ints and
+    # strings in the same object column, which Arrow refuses to store;
+    # pickle round-trips the DataFrame exactly, column names included
+    cache_file = None
+    source = Path(excel_file_path)
+    try:
+        stat = source.stat()
+        cache_file = source.with_suffix(
+            source.suffix + f".{stat.st_mtime_ns}_{stat.st_size}.pkl"
+        )
+        if cache_file.exists():
+            return pd.read_pickle(cache_file)
+    except Exception:
+        cache_file = None
+
+    if CALAMINE_AVAILABLE:
+        # Callable usecols keeps narrower sheets working; an explicit index
+        # list would raise if the workbook has fewer columns
+        student_data = pd.read_excel(
+            excel_file_path, header=None, engine="calamine", dtype=object,
+            usecols=lambda column: column <= LAST_USED_COLUMN)
+    else:
+        workbook = openpyxl.load_workbook(
+            excel_file_path, read_only=True, data_only=True, keep_links=False
+        )
+        try:
+            worksheet = workbook.active
+            row_count = worksheet.max_row
+            column_count = worksheet.max_column
+            if column_count:
+                column_count = min(column_count, LAST_USED_COLUMN + 1)
+            if row_count and column_count:
+                # Stream rows straight into a preallocated object array
+                # instead of accumulating a list of tuples first
+                cell_values = np.empty((row_count, column_count), dtype=object)
+                for row_index, row in enumerate(worksheet.iter_rows(values_only=True)):
+                    row = row[:column_count]
+                    cell_values[row_index, :len(row)] = row
+            else:
+                # Read-only mode could not report the sheet dimensions
+                cell_values = [row[:LAST_USED_COLUMN + 1]
+                               for row in worksheet.iter_rows(values_only=True)]
+        finally:
+            workbook.close()
+
+        student_data = pd.DataFrame(cell_values)
+
+    if cache_file is not None:
+        try:
+            student_data.to_pickle(cache_file)
+            # Drop caches left behind by older versions of this file
+            for stale in source.parent.glob(source.name + ".*.pkl"):
+                if stale != cache_file:
+                    stale.unlink(missing_ok=True)
+        except Exception:
+            # The cache is purely opportunistic; a read-only folder just
+            # means no sidecar
+            pass
+
+    return student_data
+
+
 def find_rows_containing_program_name(student_data, program_name_to_find):
     """
     Searches through student data to find all rows that contain a specific program name.
@@ -50,23 +147,90 @@ def find_rows_containing_month_number(student_data, month_number_to_find):
     Returns:
     - A list of row numbers where this month number was found
     """
-    matching_row_numbers = []
-    
-    # Look through each cell in the third column (index 2 = column C)
-    for row_index, cell_value in enumerate(student_data.iloc[:, 2], start=1):
-        # Skip empty cells
-        if pd.isna(cell_value):
-            continue
-        
-        # Try to convert to number and compare
-        try:
-            if int(cell_value) == month_number_to_find:
-                matching_row_numbers.append(row_index)
-        except ValueError:
-            # Skip cells that aren't numbers
-            continue
-    
-    return matching_row_numbers
+    # One errors='coerce' pass replaces the per-cell pd.isna check and the
+    # int() try/except: non-numeric cells become NaN, which never compares
+    # equal, and NumPy finds all the matches in C
+    month_column = pd.to_numeric(student_data.iloc[:, 2], errors='coerce').to_numpy()
+    matching_rows = np.flatnonzero(month_column == month_number_to_find) + 1
+    return matching_rows.tolist()
+
+
+def find_rows_for_all_months(student_data):
+    """
+    Finds the rows for every month (1-12) in a single pass over the data.
+
+    What this does:
+    - Converts the month column (column C) to numbers once, with anything
+      that isn't a number becoming NaN
+    - Buckets every valid row by its month in one sweep, instead of
+      re-scanning the whole column twelve times (once per month)
+
+    Parameters:
+    - student_data: The Excel data loaded as a DataFrame
+
+    Returns:
+    - A dict of {month_number: [row_numbers]} covering months 1-12, with an
+      empty list for months that don't appear in the data
+    """
+    month_column = pd.to_numeric(student_data.iloc[:, 2], errors='coerce').to_numpy()
+
+    rows_by_month = {month: [] for month in range(1, 13)}
+
+    # One vectorized validity mask; only the matching rows are touched in
+    # Python, and row numbers are 1-based like Excel
+    valid = (month_column >= 1) & (month_column <= 12)
+    row_numbers = np.flatnonzero(valid) + 1
+    month_values = month_column[valid].astype(int)
+
+    for row_number, month_number in zip(row_numbers.tolist(), month_values.tolist()):
+        rows_by_month[month_number].append(row_number)
+
+    return rows_by_month
+
+
+def scan_all_boundaries(student_data, program_name_mappings, program_name_set=None):
+    """
+    Finds the start and stop rows for every program in a single pass.
+
+    What this does:
+    - Matches every program name at once with a single vectorized isin() pass
+      over the program-name column (column B), instead of re-scanning the
+      whole sheet once per program
+    - Only the matching rows (a handful per program) are touched in Python
+    - Records the first and last row where each program appears
+
+    Parameters:
+    - student_data: The Excel data loaded as a DataFrame
+    - program_name_mappings: Dict mapping full program names to short codes
+    - program_name_set: Optional precomputed frozenset of the mapping keys,
+      for callers that scan repeatedly with the same mappings
+
+    Returns:
+    - A dict of {short_code: {"start": first_row, "stop": last_row}} with
+      None values for programs that were not found
+    """
+    if program_name_set is None:
+        program_name_set = frozenset(program_name_mappings)
+
+    program_boundaries = {}
+    for short_code in program_name_mappings.values():
+        program_boundaries[short_code] = {"start": None, "stop": None}
+
+    # Vectorized comparison runs in C; flatnonzero gives 1-based row numbers
+    name_column = student_data.iloc[:, 1]
+    matching_rows = np.flatnonzero(name_column.isin(program_name_set).to_numpy()) + 1
+
+    for row_number in matching_rows:
+        # Plain int so the boundaries stay JSON-serializable for saved configs
+        row_number = int(row_number)
+        short_code = program_name_mappings[name_column.iat[row_number - 1]]
+
+        boundaries = program_boundaries[short_code]
+        if boundaries["start"] is None:
+            boundaries["start"] = row_number
+        boundaries["stop"] = row_number
+
+    return program_boundaries
 
 
 def find_program_boundary_rows(list_of_row_numbers):
@@ -93,131 +257,152 @@ def find_program_boundary_rows(list_of_row_numbers):
     return first_row, last_row
 
 
-def extract_student_attendance_data(monthly_attendance_by_program, program_boundary_info, student_data):
+def extract_student_attendance_data(monthly_attendance_by_program, program_boundary_info, student_data,
+                                    progress_cb=None):
     """
     Extracts attendance data for each program and month combination.
-    
+
     What this does:
     - For each month and program combination, it creates a descriptive name
     - It extracts the attendance value from the appropriate column
     - Creates a dictionary with all the attendance data organized by program and month
-    
+
     Parameters:
     - monthly_attendance_by_program: Dict showing which months appear in which rows
     - program_boundary_info: Dict showing where each program's data starts and ends
     - student_data: The Excel data loaded as a DataFrame
-    
+    - progress_cb: Optional progress_cb(rows_done, rows_total) callback, invoked
+      once per month batch so progress reporting never dominates the extraction
+
     Returns:
     - A dictionary with descriptive names as keys and attendance values as values
     """
     attendance_data_dictionary = {}
-    
+
+    # Grab the underlying ndarray once: the hot loop below reads three
+    # cells per matching row, and plain ndarray indexing skips the pandas
+    # .iloc machinery on every one of those reads
+    data_values = student_data.to_numpy(copy=False)
+
+    # Collect the usable boundaries once. Inverted spans (start > stop,
+    # which the adjustment step can produce when the sheet's block order
+    # differs from the expected adjacency) simply never match, the same way
+    # the old per-row bounds check treated them, and overlapping spans each
+    # get their own match below
+    valid_boundaries = [
+        (code, info["start"], info["stop"])
+        for code, info in program_boundary_info.items()
+        if info["start"] is not None and info["stop"] is not None
+    ]
+
+    rows_total = sum(len(rows) for rows in monthly_attendance_by_program.values())
+    rows_done = 0
+
     # For each month (1-12)
     for month_number, rows_with_this_month in monthly_attendance_by_program.items():
-        # For each row where this month appears
-        for current_row_number in rows_with_this_month:
-            # For each program we're tracking
-            for program_code, boundary_info in program_boundary_info.items():
-                # Check if we have valid boundaries for this program
-                program_start_row = boundary_info["start"]
-                program_end_row = boundary_info["stop"]
-                
-                if program_start_row is not None and program_end_row is not None:
-                    # Check if this row falls within this program's boundaries
-                    if program_start_row <= current_row_number <= program_end_row:
-                        # Extract the age group from column E (index 4)
-                        age_group = student_data.iloc[current_row_number - 1, 4]
-                        
-                        # Extract the month number from column C (index 2)
-                        month_value = student_data.iloc[current_row_number - 1, 2]
-                        
-                        # Extract the attendance value from column AJ (index 35)
-                        attendance_value = student_data.iloc[current_row_number - 1, 35]
-                        
-                        # Create a descriptive name for this data point
-                        descriptive_field_name = f"{program_code}_Month_{month_value}_{age_group}: "
-                        
-                        # Store the attendance value with this descriptive name
-                        attendance_data_dictionary[descriptive_field_name] = attendance_value
-    
-    return attendance_data_dictionary
+        rows_done += len(rows_with_this_month)
+        if not valid_boundaries or not rows_with_this_month:
+            continue
 
+        row_numbers = np.asarray(rows_with_this_month)
 
-# =============================================================================
-# EXCEL WRITING FUNCTIONS
-# =============================================================================
+        for program_code, start_row, stop_row in valid_boundaries:
+            # One vectorized range test per program, instead of a Python
+            # bounds check per (row, program) pair
+            in_range = (row_numbers >= start_row) & (row_numbers <= stop_row)
+            if not in_range.any():
+                continue
+
+            matched_indices = row_numbers[in_range] - 1
+
+            # Build this program's field names for the month in one batched
+            # string concatenation instead of one f-string per row:
+            # "<code>_Month_<column C>_<column E>: "
+            descriptive_field_names = (
+                program_code + "_Month_"
+                + pd.Series(data_values[matched_indices, 2]).astype(str)
+                + "_" + pd.Series(data_values[matched_indices, 4]).astype(str)
+                + ": "
+            )
+
+            # Pair each name with its attendance value from column AJ
+            # (index 35); NaN (only value that is not equal to itself) is
+            # normalized to 0 so consumers never need per-value isna checks
+            attendance_values = [
+                0 if value != value else value
+                for value in data_values[matched_indices, 35].tolist()
+            ]
+            attendance_data_dictionary.update(
+                zip(descriptive_field_names.tolist(), attendance_values)
+            )
+
+        # Report progress once per month batch, not per row
+        if progress_cb is not None:
+            progress_cb(rows_done, rows_total)
+
+    if progress_cb is not None:
+        progress_cb(rows_total, rows_total)
 
-def write_single_value_to_excel_cell(excel_file_path, worksheet_name, target_cell, value_to_write):
+    return attendance_data_dictionary
+
+
+def build_consolidation_tensor(raw_attendance_data, program_consolidation_rules,
+                               months, age_groups):
     """
-    Writes a single value to a specific cell in an Excel file.
-    
+    Turns the extracted attendance dictionary into consolidation tensors.
+
     What this does:
-    - Opens an Excel file
-    - Finds the specified worksheet
-    - Writes a value to a specific cell (like "E10")
-    - Saves the file
-    
+    - Gives every child program a row in a (children x months x ages) float
+      tensor, gathered from the dictionary in one pass with NaN and
+      non-numbers normalized to 0
+    - Builds the fixed parent-to-children membership matrix from the
+      consolidation rules
+    - Contracts the two in a single einsum call, producing every parent's
+      consolidated totals at once with no per-cell Python work
+
     Parameters:
-    - excel_file_path: Full path to the Excel file
-    - worksheet_name: Name of the worksheet tab
-    - target_cell: Cell reference like "E10", "F15", etc.
-    - value_to_write: The value to put in that cell
+    - raw_attendance_data: Dict from extract_student_attendance_data
+    - program_consolidation_rules: Dict mapping parents to child programs
+    - months: The month numbers to include (in order)
+    - age_groups: The age-group labels to include (in order)
+
+    Returns:
+    - (parent_programs, child_index, raw, consolidated) where raw is the
+      per-child tensor and consolidated is the per-parent tensor
     """
-    workbook = openpyxl.load_workbook(excel_file_path)
-    worksheet = workbook[worksheet_name]
-    worksheet[target_cell] = value_to_write
-    workbook.save(excel_file_path)
+    months = list(months)
 
+    all_children = []
+    for child_programs in program_consolidation_rules.values():
+        for child_program in child_programs:
+            if child_program not in all_children:
+                all_children.append(child_program)
+    child_index = {child: row for row, child in enumerate(all_children)}
 
-def write_program_data_one_by_one(attendance_data, output_excel_path, output_worksheet_name):
-    """
-    Writes attendance data to Excel one cell at a time (slower method).
-    
-    This function is currently not used but kept for reference.
-    It writes each value individually, which is slower than batch writing.
-    
-    Parameters:
-    - attendance_data: Dictionary with attendance data
-    - output_excel_path: Path to the output Excel file
-    - output_worksheet_name: Name of the worksheet to write to
-    """
-    # Define where to start writing data in the Excel sheet
-    starting_row = 9
-    starting_column = 5  # Column E
-    
-    print("Writing data to Excel one cell at a time...")
-    
-    start_time = time.time()
-    progress_bar = tqdm(total=len(attendance_data), desc="Writing Progress")
-    
-    # Write each piece of data one by one
-    for index, (data_description, attendance_value) in enumerate(attendance_data.items()):
-        # Calculate where to put this data
-        current_row = starting_row + index
-        current_column = starting_column + (index % 4)  # Move columns every 4 entries
-        
-        # Add a small delay (remove if not needed)
-        time.sleep(1)
-        
-        # Convert column number to letter and write the value
-        cell_reference = f"{openpyxl.utils.get_column_letter(current_column)}{current_row}"
-        write_single_value_to_excel_cell(
-            output_excel_path,
-            output_worksheet_name,
-            cell_reference,
-            attendance_value
-        )
-        
-        # Update the progress bar
-        progress_bar.update(1)
-        progress_bar.set_postfix({"Current Program": data_description})
-    
-    progress_bar.close()
-    
-    end_time = time.time()
-    total_time = end_time - start_time
-    print(f"Data written successfully in {total_time:.2f} seconds.")
+    child_values = [
+        raw_attendance_data.get(f"{child_program}_Month_{month}_{age_group}: ", 0)
+        for child_program in all_children
+        for month in months
+        for age_group in age_groups
+    ]
+    raw = pd.to_numeric(pd.Series(child_values), errors='coerce').to_numpy(dtype=float)
+    raw = np.nan_to_num(raw, copy=False).reshape(
+        len(all_children), len(months), len(age_groups))
 
+    parent_programs = list(program_consolidation_rules)
+    membership = np.zeros((len(parent_programs), len(all_children)), dtype=np.int8)
+    for parent_position, parent_program in enumerate(parent_programs):
+        for child_program in program_consolidation_rules[parent_program]:
+            membership[parent_position, child_index[child_program]] = 1
+
+    consolidated = np.einsum('pc,cma->pma', membership, raw)
+
+    return parent_programs, child_index, raw, consolidated
+
+
+# =============================================================================
+# EXCEL WRITING FUNCTIONS
+# =============================================================================
 
 def write_all_attendance_data_to_excel_efficiently(attendance_data, output_excel_path, output_worksheet_name):
     """
@@ -608,24 +793,16 @@ def run_ada_audit_process():
     # STEP 3: Load the attendance data from Excel
     # =================================================================
     print("📊 Loading student attendance data from Excel...")
-    student_attendance_data = pd.read_excel(input_attendance_file, header=None)
+    student_attendance_data = load_student_attendance_data(input_attendance_file)
     
     # =================================================================
     # STEP 4: Find where each program's data starts and ends
     # =================================================================
     print("🔍 Locating program boundaries in the data...")
-    
-    program_boundaries = {}
-    for short_code in program_name_mappings.values():
-        program_boundaries[short_code] = {"start": None, "stop": None}
-    
-    # Find the row ranges for each program
-    for full_program_name, short_code in program_name_mappings.items():
-        matching_rows = find_rows_containing_program_name(student_attendance_data, full_program_name)
-        start_row, end_row = find_program_boundary_rows(matching_rows)
-        program_boundaries[short_code]["start"] = start_row
-        program_boundaries[short_code]["stop"] = end_row
-    
+
+    # Find the row ranges for all programs in one pass over the sheet
+    program_boundaries = scan_all_boundaries(student_attendance_data, program_name_mappings)
+
     # =================================================================
     # STEP 5: Adjust boundaries to prevent overlaps
     # =================================================================
@@ -751,7 +928,9 @@ def run_ada_audit_process():
                     child_field_pattern = f"{child_program}_Month_{month}_{age_group}: "
                     child_value = raw_attendance_data.get(child_field_pattern, 0)
                     
-                    if child_value and not pd.isna(child_value) and child_value != 0:
+                    # Extraction already normalized NaN to 0, so a plain
+                    # truthiness check is enough here
+                    if child_value:
                         total_value += child_value
                         found_values.append(f"{child_program}: {child_value}")
                 
@@ -1,38 +1,83 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
-import pandas as pd
-import openpyxl
-from tqdm import tqdm
+import importlib.util
+# numpy backs the boundary array and is cheap to load eagerly;
+# pandas/openpyxl stay lazy (see below)
+import numpy as np
 import time
-import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from operator import itemgetter
 from pathlib import Path
 import sys
 import os
 import json
-import copy
+import sqlite3
+import hashlib
 from datetime import datetime
 
-# Import functions from the original ADA audit script
+# Heavy libraries (pandas, openpyxl) and the audit functions that pull
+# them in are imported lazily at first use so the window appears without
+# paying their startup cost
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from ADA_Audit_25_26_IMPROVED import (
-    find_rows_containing_program_name,
-    find_rows_containing_month_number,
-    find_program_boundary_rows,
-    extract_student_attendance_data,
-    write_all_attendance_data_to_excel_efficiently
-)
-
-# Import the ADA Dashboard module
+
+# Only check that the ADA Dashboard module exists; import it when the
+# user actually runs the dashboard
+DASHBOARD_AVAILABLE = importlib.util.find_spec("ADA_Dashboard_Module") is not None
+if not DASHBOARD_AVAILABLE:
+    print("Warning: ADA Dashboard module not available")
+
+# Optional Rust-backed JSON codec for config/cache round-trips; the stdlib
+# json module is the fallback, same pattern as the calamine Excel reader
 try:
-    from ADA_Dashboard_Module import (
-        run_ada_dashboard_with_boundaries,
-        get_dashboard_configuration_from_user,
-        validate_boundaries_for_dashboard
-    )
-    DASHBOARD_AVAILABLE = True
-except ImportError as e:
-    print(f"Warning: ADA Dashboard module not available: {e}")
-    DASHBOARD_AVAILABLE = False
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    def _json_dumps_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj):
+        return json.dumps(obj)
+
+    def _json_dumps_pretty(obj):
+        return json.dumps(obj, indent=2).encode()
+
+# ADA Compliant color palettes, built once at module load. Instances keep
+# self.colors as a live copy because high contrast mode swaps values in
+DEFAULT_COLORS = {
+    'background': '#FFFFFF',           # White background for maximum contrast
+    'primary': "#003366",              # Dark blue for primary elements
+    'secondary': '#006600',            # Dark green for secondary elements
+    'accent': '#CC0000',               # Red for alerts/important actions
+    'text': '#000000',                 # Black text for maximum readability
+    'text_light': '#333333',           # Dark gray for secondary text
+    'border': '#666666',               # Medium gray for borders
+    'success': '#004400',              # Dark green for success states
+    'warning': '#CC6600',              # Orange for warnings
+    'error': '#CC0000'                 # Red for errors
+}
+
+HIGH_CONTRAST_COLORS = {
+    'background': '#000000',           # Black background
+    'primary': '#FFFFFF',              # White for primary elements
+    'secondary': '#FFFF00',            # Yellow for secondary elements
+    'accent': '#FF0000',               # Red for alerts
+    'text': '#003366',                 # Dark blue text
+    'text_light': '#003366',           # Dark blue for secondary text
+    'border': '#FFFFFF',               # White borders
+    'success': '#00FF00',              # Bright green for success
+    'warning': '#FFFF00',              # Yellow for warnings
+    'error': '#FF0000'                 # Red for errors
+}
 
 
 class ADAAuditGUI:
@@ -52,21 +97,18 @@ class ADAAuditGUI:
         self.root.geometry("1200x800")
         
         # ADA Compliant color scheme with high contrast
-        self.colors = {
-            'background': '#FFFFFF',           # White background for maximum contrast
-            'primary': "#003366",              # Dark blue for primary elements
-            'secondary': '#006600',            # Dark green for secondary elements
-            'accent': '#CC0000',               # Red for alerts/important actions
-            'text': '#000000',                 # Black text for maximum readability
-            'text_light': '#333333',           # Dark gray for secondary text
-            'border': '#666666',               # Medium gray for borders
-            'success': '#004400',              # Dark green for success states
-            'warning': '#CC6600',              # Orange for warnings
-            'error': '#CC0000'                 # Red for errors
-        }
+        self.colors = dict(DEFAULT_COLORS)
         
         self.root.configure(bg=self.colors['background'])
-        
+
+        # One shared ttk.Style handle; the style database is global per
+        # interpreter, so there is no reason to construct new ones
+        self._style = ttk.Style(self.root)
+
+        # Define every widget style exactly once up front; section builders
+        # only reference styles by name
+        self._configure_styles()
+
         # Configure accessibility features
         self.setup_accessibility_features()
         
@@ -74,6 +116,19 @@ class ADAAuditGUI:
         self.input_file_path = tk.StringVar()
         self.output_file_path = tk.StringVar()
         self.worksheet_name = tk.StringVar(value="Template- Apportionment Summary")
+
+        # Cached Path objects mirroring the file-path variables; refreshed
+        # whenever the vars change so hot paths skip re-parsing the strings
+        self._input_path = None
+        self._output_path = None
+
+        # Progress/status variables live here (not in the control section
+        # builder) so they can be set before the section is built
+        self.progress_var = tk.DoubleVar()
+        self._last_progress_ts = 0.0  # throttle state for _set_progress
+        self._last_progress_value = None
+        self._last_status_text = None  # skip state for _set_status
+        self.status_var = tk.StringVar(value="Ready to begin")
         
         # Program mappings from original script (updated with new McClellan and SYC locations)
         self.program_name_mappings = {
@@ -108,24 +163,77 @@ class ADAAuditGUI:
             "Prog_K_TK": ["Prog_K_TK"],
         }
         
-        # Initialize program boundaries storage
-        self.program_boundaries = {}
-        for short_code in self.program_name_mappings.values():
-            self.program_boundaries[short_code] = {"start": None, "stop": None}
+        # Precompute lookup structures derived from the mappings so each
+        # load/consolidation run doesn't rebuild them
+        self._rebuild_mapping_indexes()
+
+        # Initialize program boundaries storage: one int32 array with a row
+        # per program code and columns [start, stop], -1 meaning "not found".
+        # The program_boundaries property exposes the familiar dict view.
+        self._code_index = {code: i for i, code in enumerate(self.program_name_mappings.values())}
+        self._boundaries = np.full((len(self._code_index), 2), -1, dtype=np.int32)
         
         # Data storage
         self.student_attendance_data = None
         self.extracted_attendance_data = None
-        
+
+        # Worker threads hand results back to the Tk thread through this
+        # queue; _drain_io_queue polls it via root.after
+        self._io_queue = queue.Queue()
+        self.root.after(50, self._drain_io_queue)
+
+        # Pending debounced resize callback id (see _schedule_resize)
+        self._resize_job = None
+
+        # Focus auto-scroll coalescing state: pending after_idle id, the
+        # widget to scroll to, and a cached main_frame requested height
+        self._focus_scroll_after = None
+        self._focus_scroll_widget = None
+        self._main_frame_reqheight = None
+        self._cached_canvas_height = None
+
+        # Buffered log lines, drained into the Text widget in one batched
+        # insert every 100ms by _flush_log (armed in create_widgets). This
+        # also covers lines logged before the results widget exists
+        self._log_buffer = deque()
+
         # Table sorting state
         self.sort_column = None
         self.sort_reverse = False
         self.boundary_data = []  # Store boundary data for sorting
-        
-        # Boundary settings management
+        self.boundary_rows = {}  # iid (program code) -> row dict, same objects
+
+        # Per-cell consolidation breakdowns are noisy and each line costs a
+        # Tcl insert; flip this on when debugging consolidation totals
+        self.verbose_logging = False
+
+        # Month-occurrence scan cache, keyed by (input path, mtime)
+        self._month_rows_cache = {}
+
+        # One long-lived worker thread runs every background task (load,
+        # audit, dashboard) sequentially: no per-click thread startup, and
+        # the heavy modules imported on the first task stay warm
+        self._task_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='audit')
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+        # Boundary settings management: saved configurations live in one
+        # SQLite file instead of a JSON file per configuration, so startup
+        # is a single indexed read rather than a glob + parse per file
         self.settings_directory = Path(os.path.dirname(os.path.abspath(__file__))) / "boundary_settings"
         self.settings_directory.mkdir(exist_ok=True)
+        self._cfg_db = sqlite3.connect(self.settings_directory / "configs.sqlite")
+        self._cfg_db.execute(
+            "CREATE TABLE IF NOT EXISTS configs(name TEXT PRIMARY KEY, data BLOB, mtime INT)"
+        )
+        # Listing metadata lives in its own columns so startup never has to
+        # parse full config bodies; bodies are loaded on demand
+        for column_def in ("description TEXT", "created TEXT", "programs INT"):
+            try:
+                self._cfg_db.execute(f"ALTER TABLE configs ADD COLUMN {column_def}")
+            except sqlite3.OperationalError:
+                pass  # column already exists
         self.saved_configurations = {}
+        self._config_bodies = {}  # on-demand cache of parsed config bodies
         
         # Create the GUI
         self.create_widgets()
@@ -139,32 +247,40 @@ class ADAAuditGUI:
     def setup_accessibility_features(self):
         """Configure accessibility features for ADA compliance"""
         
-        # Set up keyboard navigation
+        # Set up keyboard navigation; Tab traversal itself is Tk's native
+        # creation-order behavior, no Python-side list needed
         self.root.focus_set()
+
+        # Set up screen reader announcements (bounded so a long session
+        # with frequent progress updates doesn't grow this forever)
+        self.status_announcements = deque(maxlen=256)
         
-        # Configure tab order tracking
-        self.tab_order_widgets = []
-        
-        # Set up screen reader announcements
-        self.status_announcements = []
-        
-        # Configure high contrast mode detection
+        # Configure high contrast mode detection via the documented Win32
+        # call (SPI_GETHIGHCONTRAST) instead of probing the registry
         try:
-            # Windows high contrast detection (if available)
-            import winreg
-            try:
-                key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
-                                   r"Control Panel\Accessibility\HighContrast")
-                value, reg_type = winreg.QueryValueEx(key, "Flags")
-                # Convert to int if it's a string
-                if isinstance(value, str):
-                    value = int(value)
-                if value & 1:  # High contrast is enabled
-                    self.enable_high_contrast_mode()
-                winreg.CloseKey(key)
-            except (FileNotFoundError, PermissionError, ValueError):
-                pass
-        except ImportError:
+            import ctypes
+
+            # HIGHCONTRASTW struct; lpszDefaultScheme is a pointer, so the
+            # layout (and cbSize) differs between 32- and 64-bit Python -
+            # SystemParametersInfoW rejects the call if cbSize is wrong
+            class HIGHCONTRASTW(ctypes.Structure):
+                _fields_ = [
+                    ("cbSize", ctypes.c_uint),
+                    ("dwFlags", ctypes.c_uint),
+                    ("lpszDefaultScheme", ctypes.c_void_p),
+                ]
+
+            high_contrast = HIGHCONTRASTW()
+            high_contrast.cbSize = ctypes.sizeof(high_contrast)
+            SPI_GETHIGHCONTRAST = 0x0042
+            HCF_HIGHCONTRASTON = 0x1
+            if ctypes.windll.user32.SystemParametersInfoW(
+                SPI_GETHIGHCONTRAST, ctypes.sizeof(high_contrast),
+                ctypes.byref(high_contrast), 0
+            ) and (high_contrast.dwFlags & HCF_HIGHCONTRASTON):
+                self.enable_high_contrast_mode()
+        except (AttributeError, OSError):
+            # Not on Windows, or the call isn't available
             pass
         
         # Set up keyboard shortcuts
@@ -232,7 +348,7 @@ class ADAAuditGUI:
         """Configure visible focus indicators"""
         
         # Configure ttk styles for better focus visibility
-        style = ttk.Style()
+        style = self._style
         
         # High contrast focus ring
         style.configure('Focus.TButton',
@@ -256,23 +372,12 @@ class ADAAuditGUI:
     def enable_high_contrast_mode(self):
         """Enable high contrast color scheme"""
         
-        self.colors.update({
-            'background': '#000000',           # Black background
-            'primary': '#FFFFFF',              # White for primary elements
-            'secondary': '#FFFF00',            # Yellow for secondary elements
-            'accent': '#FF0000',               # Red for alerts
-            'text': '#003366',                 # Dark blue text
-            'text_light': '#003366',           # Dark blue for secondary text
-            'border': '#FFFFFF',               # White borders
-            'success': '#00FF00',              # Bright green for success
-            'warning': '#FFFF00',              # Yellow for warnings
-            'error': '#FF0000'                 # Red for errors
-        })
+        self.colors.update(HIGH_CONTRAST_COLORS)
         
         self.root.configure(bg=self.colors['background'])
         
         # Reconfigure button styles for high contrast mode to ensure dark blue text
-        style = ttk.Style()
+        style = self._style
         style.configure('Accessible.TButton',
                        foreground='#003366',  # Force dark blue text in high contrast mode
                        background=self.colors['primary'],  # White background
@@ -394,37 +499,27 @@ For additional assistance, contact your system administrator."""
         help_dialog.bind('<Return>', lambda e: help_dialog.destroy())
     
     def add_to_tab_order(self, widget):
-        """Add widget to tab order for keyboard navigation"""
-        self.tab_order_widgets.append(widget)
-        
-        # Configure accessible focus events - only for widgets that support highlight options
-        def on_focus_in(event):
-            try:
-                # Only apply highlight options to widgets that support them
-                widget_class = widget.__class__.__name__
-                if widget_class in ['Entry', 'Text', 'Listbox', 'Canvas']:
-                    widget.configure(highlightthickness=3, highlightcolor=self.colors['accent'])
-                elif widget_class == 'Button':
-                    # Use relief changes for buttons instead
-                    widget.configure(relief='solid', borderwidth=3)
-            except tk.TclError:
-                # Widget doesn't support these options, ignore
-                pass
-            
-        def on_focus_out(event):
+        """Register a focusable widget for keyboard navigation.
+
+        Tab traversal is handled natively by Tk in widget creation order,
+        so there is no list to maintain or walk here."""
+
+        # Widgets in the tab order should also scroll the main canvas
+        self.add_scrollable_tag(widget)
+
+        # Let Tk draw the focus ring natively instead of binding Python
+        # FocusIn/FocusOut callbacks per widget: highlightcolor only shows
+        # while the widget has focus, so no event handlers are needed.
+        # ttk widgets ignore these options; their focus ring comes from the
+        # Focus.* styles configured in setup_focus_indicators.
+        if widget.winfo_class() in ('Entry', 'Text', 'Listbox', 'Canvas', 'Button'):
             try:
-                widget_class = widget.__class__.__name__
-                if widget_class in ['Entry', 'Text', 'Listbox', 'Canvas']:
-                    widget.configure(highlightthickness=1, highlightcolor=self.colors['border'])
-                elif widget_class == 'Button':
-                    # Reset button appearance
-                    widget.configure(relief='raised', borderwidth=2)
+                widget.configure(highlightthickness=2,
+                                 highlightcolor=self.colors['accent'],
+                                 highlightbackground=self.colors['border'])
             except tk.TclError:
                 # Widget doesn't support these options, ignore
                 pass
-        
-        widget.bind('<FocusIn>', on_focus_in)
-        widget.bind('<FocusOut>', on_focus_out)
     
     def create_scrollable_main_container(self):
         """Create a scrollable main container for the entire interface"""
@@ -450,10 +545,10 @@ For additional assistance, contact your system administrator."""
         self.main_frame.bind('<Configure>', self.on_frame_configure)
         self.main_canvas.bind('<Configure>', self.on_canvas_configure)
         
-        # Bind mouse wheel scrolling
-        self.bind_mousewheel(self.root)
-        self.bind_mousewheel(self.main_canvas)
-        self.bind_mousewheel(self.main_frame)
+        # Bind mouse wheel scrolling once via a shared class tag; widgets
+        # opt in by carrying the "Scrollable" bindtag instead of each
+        # getting their own Python handler
+        self.setup_mousewheel_scrolling()
         
         # Configure additional scrolling behavior
         self.setup_scroll_behavior()
@@ -463,20 +558,34 @@ For additional assistance, contact your system administrator."""
     
     def on_frame_configure(self, event):
         """Update scroll region when frame size changes"""
-        # Use after_idle to ensure all widgets are properly sized before updating scroll region
-        self.root.after_idle(self.update_scroll_region)
-    
+        # Sections re-gridding inside the frame fire <Configure> even when
+        # the frame's overall size is unchanged; those don't move the
+        # scroll region, so don't let them fan out into a resize pass
+        if self._main_frame_reqheight == event.height:
+            return
+        # The <Configure> event already carries the new height, so the
+        # focus-scroll math never needs a winfo_reqheight geometry pass
+        self._main_frame_reqheight = event.height
+        # Debounce so a burst of <Configure> events triggers one update
+        self._schedule_resize()
+
     def on_canvas_configure(self, event):
         """Update frame size when canvas size changes (handles orientation changes)"""
         # Update the frame width to match canvas width
         canvas_width = event.width
         canvas_height = event.height
-        
-        # Configure the frame to match the canvas width
-        self.main_canvas.itemconfig(self.canvas_frame_id, width=canvas_width)
-        
+
+        # Cache the viewport height for the focus-scroll math
+        self._cached_canvas_height = canvas_height
+
+        # Configure the frame to match the canvas width - but only when the
+        # width moved, so pure height changes don't force the whole frame
+        # (and every section in it) to re-layout
+        if self.main_canvas.itemcget(self.canvas_frame_id, 'width') != str(canvas_width):
+            self.main_canvas.itemconfig(self.canvas_frame_id, width=canvas_width)
+
         # Force update of scroll region after canvas resize
-        self.root.after_idle(self.update_scroll_region)
+        self._schedule_resize()
         
         # Log orientation change for debugging
         if hasattr(self, '_last_canvas_size'):
@@ -512,32 +621,11 @@ For additional assistance, contact your system administrator."""
                         self.main_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
                     else:
                         self.main_scrollbar.grid_remove()
-                    
-                    # Ensure mouse wheel scrolling works after orientation change
-                    self.refresh_mousewheel_bindings()
-                    
+
         except Exception as e:
             # Silent error handling to prevent GUI disruption
             pass
-    
-    def refresh_mousewheel_bindings(self):
-        """Refresh mouse wheel bindings after orientation changes"""
-        try:
-            # Re-bind mouse wheel events to ensure they work after orientation change
-            widgets_to_rebind = [self.root, self.main_canvas, self.main_frame]
-            
-            for widget in widgets_to_rebind:
-                if widget and widget.winfo_exists():
-                    # Remove existing bindings
-                    widget.unbind("<MouseWheel>")
-                    widget.unbind("<Button-4>")
-                    widget.unbind("<Button-5>")
-                    
-                    # Re-apply mouse wheel bindings
-                    self.bind_mousewheel(widget)
-        except:
-            pass
-    
+
     def on_window_configure(self, event):
         """Handle window resize events including orientation changes"""
         # Only handle events for the root window
@@ -545,107 +633,69 @@ For additional assistance, contact your system administrator."""
             # Get new window dimensions
             new_width = event.width
             new_height = event.height
-            
+
             # Check if this is a significant size change (orientation change)
             if hasattr(self, '_last_window_size'):
                 old_width, old_height = self._last_window_size
                 width_change = abs(new_width - old_width)
                 height_change = abs(new_height - old_height)
-                
+
                 # If the change is significant, update scroll configuration
                 if width_change > 100 or height_change > 100:
                     self.log_message(f"🔄 Window resized: {old_width}x{old_height} → {new_width}x{new_height}")
-                    
-                    # Schedule scroll region update after a brief delay to ensure layout is complete
-                    self.root.after(100, self.update_scroll_region)
-                    
-                    # Also refresh the entire scrolling system
-                    self.root.after(150, self.refresh_scrolling_system)
-            
+                    self._schedule_resize()
+
             self._last_window_size = (new_width, new_height)
-    
-    def refresh_scrolling_system(self):
-        """Refresh the entire scrolling system after major layout changes"""
-        try:
-            # Update scroll region
-            self.update_scroll_region()
-            
-            # Refresh mouse wheel bindings
-            self.refresh_mousewheel_bindings()
-            
-            # Force a redraw of the canvas
-            if hasattr(self, 'main_canvas'):
-                self.main_canvas.update_idletasks()
-            
-            self.log_message("🔄 Scrolling system refreshed")
-            
-        except Exception as e:
-            self.log_message(f"⚠️ Error refreshing scrolling system: {e}")
-    
-    def bind_mousewheel(self, widget):
-        """Bind mouse wheel scrolling to a widget"""
+
+    def _schedule_resize(self):
+        """Debounce resize handling: one trailing-edge scroll region update"""
+        # <Configure> can fire dozens of times during a window drag, so
+        # cancel any pending update and reschedule it
+        if self._resize_job is not None:
+            try:
+                self.root.after_cancel(self._resize_job)
+            except tk.TclError:
+                pass
+        self._resize_job = self.root.after(120, self._do_resize)
+
+    def _do_resize(self):
+        """Run the deferred scroll region update once the resize settles"""
+        self._resize_job = None
+        self.update_scroll_region()
+    
+    def setup_mousewheel_scrolling(self):
+        """Bind mouse wheel scrolling once through a shared class tag"""
+        # Widgets that should scroll the main canvas carry the "Scrollable"
+        # bindtag, so membership is resolved by Tk's event dispatch instead
+        # of a Python ancestor walk on every wheel tick
         def _on_mousewheel(event):
-            # Only scroll if the canvas exists and is viewable
-            if (hasattr(self, 'main_canvas') and 
-                self.main_canvas.winfo_exists() and
-                self.main_canvas.winfo_viewable()):
-                
-                try:
-                    # Check if mouse is over the canvas area
-                    canvas_under_mouse = (self.main_canvas.winfo_containing(event.x_root, event.y_root) == self.main_canvas)
-                    
-                    # Also allow scrolling if mouse is over any child of the main frame
-                    main_frame_under_mouse = False
-                    if hasattr(self, 'main_frame') and self.main_frame.winfo_exists():
-                        try:
-                            widget_under_mouse = self.main_canvas.winfo_containing(event.x_root, event.y_root)
-                            if widget_under_mouse:
-                                # Check if the widget under mouse is a descendant of main_frame
-                                current = widget_under_mouse
-                                while current:
-                                    if current == self.main_frame:
-                                        main_frame_under_mouse = True
-                                        break
-                                    try:
-                                        current = current.master
-                                    except:
-                                        break
-                        except:
-                            pass
-                    
-                    if canvas_under_mouse or main_frame_under_mouse:
-                        # Calculate scroll amount with better handling
-                        delta = getattr(event, 'delta', 0)
-                        if delta != 0:
-                            scroll_amount = int(-1 * (delta / 120))
-                        else:
-                            scroll_amount = -3 if event.num == 4 else 3
-                        
-                        self.main_canvas.yview_scroll(scroll_amount, "units")
-                        
-                except Exception:
-                    # Fallback scrolling if position detection fails
-                    if hasattr(event, 'delta'):
-                        self.main_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
+            if self.main_canvas.winfo_viewable():
+                self.main_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+
         def _on_mousewheel_linux_up(event):
-            if (hasattr(self, 'main_canvas') and 
-                self.main_canvas.winfo_exists() and 
-                self.main_canvas.winfo_viewable()):
-                self.main_canvas.yview_scroll(-1, "units")
-        
+            if self.main_canvas.winfo_viewable():
+                self.main_canvas.yview_scroll(-3, "units")
+
         def _on_mousewheel_linux_down(event):
-            if (hasattr(self, 'main_canvas') and 
-                self.main_canvas.winfo_exists() and 
-                self.main_canvas.winfo_viewable()):
-                self.main_canvas.yview_scroll(1, "units")
-        
+            if self.main_canvas.winfo_viewable():
+                self.main_canvas.yview_scroll(3, "units")
+
         # Bind to different wheel events for cross-platform compatibility
+        self.root.bind_class("Scrollable", "<MouseWheel>", _on_mousewheel)  # Windows
+        self.root.bind_class("Scrollable", "<Button-4>", _on_mousewheel_linux_up)  # Linux
+        self.root.bind_class("Scrollable", "<Button-5>", _on_mousewheel_linux_down)  # Linux
+
+        self.add_scrollable_tag(self.main_canvas)
+        self.add_scrollable_tag(self.main_frame)
+
+    @staticmethod
+    def add_scrollable_tag(widget):
+        """Give a widget the shared "Scrollable" mouse wheel bindtag"""
         try:
-            widget.bind("<MouseWheel>", _on_mousewheel)  # Windows
-            widget.bind("<Button-4>", _on_mousewheel_linux_up)  # Linux
-            widget.bind("<Button-5>", _on_mousewheel_linux_down)  # Linux
-        except:
+            tags = widget.bindtags()
+            if "Scrollable" not in tags:
+                widget.bindtags(("Scrollable",) + tags)
+        except tk.TclError:
             pass
     
     def setup_scroll_behavior(self):
@@ -673,64 +723,77 @@ For additional assistance, contact your system administrator."""
                 on_scroll(*args)
             ))
         
-        # Auto-scroll to focused widget
+        # Auto-scroll to focused widget, coalesced through after_idle so a
+        # Tab-through burst causes one layout+scroll instead of one each
+        main_frame_path = str(self.main_frame) + '.'
+
         def on_widget_focus(event):
             widget = event.widget
-            if hasattr(self, 'main_canvas') and self.main_canvas.winfo_viewable():
-                try:
-                    # Get widget position relative to the main frame
-                    x = widget.winfo_x()
-                    y = widget.winfo_y()
-                    
-                    # Get canvas viewport
-                    canvas_height = self.main_canvas.winfo_height()
-                    scroll_top = self.main_canvas.canvasy(0)
-                    scroll_bottom = scroll_top + canvas_height
-                    
-                    # Check if widget is visible, if not scroll to it
-                    if y < scroll_top or y > scroll_bottom - 50:  # 50px buffer
-                        # Calculate relative position to scroll to
-                        total_height = self.main_frame.winfo_reqheight()
-                        if total_height > 0:
-                            scroll_to = max(0, min(1, (y - canvas_height/2) / total_height))
-                            self.main_canvas.yview_moveto(scroll_to)
-                except:
-                    pass
-        
-        # Bind focus events to all widgets recursively
-        self.bind_focus_scroll_recursive(self.main_frame, on_widget_focus)
-    
-    def bind_focus_scroll_recursive(self, parent, focus_callback):
-        """Recursively bind focus events to enable auto-scroll to focused widgets"""
-        try:
-            parent.bind('<FocusIn>', focus_callback)
-            for child in parent.winfo_children():
+            # Class bindings fire for every widget of that class; only
+            # react to widgets inside the scrollable main frame
+            if not str(widget).startswith(main_frame_path):
+                return
+            self._focus_scroll_widget = widget
+            if self._focus_scroll_after is not None:
                 try:
-                    child.bind('<FocusIn>', focus_callback)
-                    self.bind_focus_scroll_recursive(child, focus_callback)
-                except:
+                    self.root.after_cancel(self._focus_scroll_after)
+                except tk.TclError:
                     pass
-        except:
-            pass
-    
-    def create_widgets(self):
-        """Create all GUI widgets and layout with ADA compliance"""
-        
-        # Create scrollable main container
-        self.create_scrollable_main_container()
-        
-        # Configure root grid weights
-        self.root.columnconfigure(0, weight=1)
-        self.root.rowconfigure(0, weight=1)
-        self.main_frame.columnconfigure(1, weight=1)
-        
-        # Configure accessible styling
-        style = ttk.Style()
+            self._focus_scroll_after = self.root.after_idle(self._do_focus_scroll)
+
+        # One class-level binding per focusable widget class: Tk's bindtags
+        # dispatch covers widgets created later too, so there is no need to
+        # walk the widget tree and bind each widget individually
+        for widget_class in ('TEntry', 'TButton', 'TCombobox', 'TCheckbutton',
+                             'Treeview', 'Entry', 'Text', 'Listbox'):
+            self.root.bind_class(widget_class, '<FocusIn>', on_widget_focus, add='+')
+
+    def _do_focus_scroll(self):
+        """Scroll the main canvas so the most recently focused widget is visible"""
+        self._focus_scroll_after = None
+        widget = self._focus_scroll_widget
+        if widget is None:
+            return
+        if hasattr(self, 'main_canvas') and self.main_canvas.winfo_viewable():
+            try:
+                # Get widget position relative to the main frame
+                y = widget.winfo_y()
+
+                # Get canvas viewport from the cached <Configure> metrics,
+                # falling back to a winfo query only before the first event
+                canvas_height = self._cached_canvas_height
+                if canvas_height is None:
+                    canvas_height = self.main_canvas.winfo_height()
+
+                # Compute where the widget should sit (centered), clamp to
+                # [0, 1], and only issue the scroll command when it would
+                # actually move the view. An in-view widget produces a
+                # target within epsilon of the current offset, so the old
+                # explicit visibility test is subsumed and the Tcl round
+                # trip is skipped entirely in the common case.
+                if self._main_frame_reqheight is None:
+                    self._main_frame_reqheight = self.main_frame.winfo_reqheight()
+                total_height = self._main_frame_reqheight
+                if total_height > 0:
+                    target = max(0.0, min(1.0, (y - canvas_height / 2) / total_height))
+                    current = self.main_canvas.yview()[0]
+                    if abs(current - target) > 0.005:
+                        self.main_canvas.yview_moveto(target)
+            except Exception:
+                pass
+
+    def _configure_styles(self):
+        """Define all ttk styles once at startup.
+
+        Re-running style.configure for an existing style forces every widget
+        using it to restyle, so the section builders never redefine these."""
+
+        style = self._style
         style.configure('Accessible.TLabel',
                        foreground='#000000',  # Black text for readability on white background
                        background=self.colors['background'],
                        font=('Arial', 11))
-        
+
         style.configure('Title.TLabel',
                        foreground=self.colors['primary'],  # Dark blue title text
                        background=self.colors['background'],
@@ -763,6 +826,35 @@ For additional assistance, contact your system administrator."""
                            ('pressed', self.colors['accent'])],
                  foreground=[('active', '#003366'),
                            ('pressed', '#003366')])
+
+        # Run-button states used by update_button_states; defined once here
+        # so state changes only swap the style name
+        style.configure('Warning.TButton',
+                       foreground='#FFFFFF',  # White text
+                       background=self.colors['warning'],
+                       font=('Arial', 12, 'bold'),
+                       focuscolor=self.colors['accent'],
+                       borderwidth=2,
+                       relief='raised')
+
+        style.map('Warning.TButton',
+                 background=[('active', self.colors['secondary']),
+                           ('pressed', self.colors['accent'])],
+                 foreground=[('active', '#FFFFFF'),
+                           ('pressed', '#FFFFFF')])
+
+        style.configure('Disabled.TButton',
+                       foreground='#FFFFFF',  # White text even when disabled
+                       background=self.colors['border'],
+                       font=('Arial', 12, 'bold'),
+                       borderwidth=2,
+                       relief='raised')
+
+        style.map('Disabled.TButton',
+                 background=[('active', self.colors['border']),
+                           ('pressed', self.colors['border'])],
+                 foreground=[('active', '#FFFFFF'),
+                           ('pressed', '#FFFFFF')])
         
         style.configure('Accessible.TEntry',
                        foreground='#000000',  # Black text for readability
@@ -770,7 +862,35 @@ For additional assistance, contact your system administrator."""
                        bordercolor=self.colors['border'],
                        focuscolor=self.colors['accent'],
                        font=('Arial', 11))
-        
+
+        style.configure('FileLabel.TLabel',
+                       foreground=self.colors['primary'],  # Dark blue text for file labels
+                       background=self.colors['background'],
+                       font=('Arial', 11, 'bold'))
+
+        style.configure('Accessible.Treeview',
+                       background=self.colors['background'],
+                       foreground=self.colors['text'],
+                       selectbackground=self.colors['primary'],
+                       selectforeground=self.colors['background'],
+                       font=('Arial', 10))
+
+        style.configure('Accessible.Treeview.Heading',
+                       background=self.colors['secondary'],
+                       foreground='#000000',  # Black text for header readability
+                       font=('Arial', 11, 'bold'))
+
+    def create_widgets(self):
+        """Create all GUI widgets and layout with ADA compliance"""
+
+        # Create scrollable main container
+        self.create_scrollable_main_container()
+
+        # Configure root grid weights
+        self.root.columnconfigure(0, weight=1)
+        self.root.rowconfigure(0, weight=1)
+        self.main_frame.columnconfigure(1, weight=1)
+
         # Title with proper heading hierarchy
         title_label = ttk.Label(self.main_frame, text="Automated PADC Processor", 
                                style='Title.TLabel')
@@ -790,12 +910,29 @@ For additional assistance, contact your system administrator."""
         # Program Boundaries Section
         self.create_boundaries_section(self.main_frame, row=3)
         
+        # Steps 3 and 4 (controls + results log) start below the fold, so
+        # their construction is deferred to the first idle tick: the window
+        # maps with Steps 1-2 laid out, and the deferred build finishes
+        # before the user can interact with anything it creates
+        self._sections_built = False
+        self.root.after_idle(self._build_deferred_sections)
+
+        # Start the periodic log flush; lines logged before the results
+        # widget exists simply wait in the buffer until it does
+        self.root.after(100, self._flush_log)
+
+    def _build_deferred_sections(self):
+        """Build the control and results sections on the first idle tick"""
+        if self._sections_built:
+            return
+        self._sections_built = True
+
         # Control Buttons Section
         self.create_control_section(self.main_frame, row=4)
-        
+
         # Results Section
         self.create_results_section(self.main_frame, row=5)
-        
+
     def create_file_selection_section(self, parent, row):
         """Create file selection widgets with ADA compliance"""
         
@@ -804,14 +941,8 @@ For additional assistance, contact your system administrator."""
         file_frame.grid(row=row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 15))
         file_frame.columnconfigure(1, weight=1)
         
-        # Configure accessible label style
-        style = ttk.Style()
-        style.configure('FileLabel.TLabel',
-                       foreground=self.colors['primary'],  # Dark blue text for file labels
-                       background=self.colors['background'],
-                       font=('Arial', 11, 'bold'))
-        
         # Input file selection with accessibility features
+        # (FileLabel.TLabel is defined once in _configure_styles)
         input_label = ttk.Label(file_frame, text="Input Attendance File (Ctrl+O):", 
                                style='FileLabel.TLabel')
         input_label.grid(row=0, column=0, sticky=tk.W, pady=(0, 8))
@@ -911,25 +1042,22 @@ For additional assistance, contact your system administrator."""
         self.boundaries_tree.column('Start Row', width=120, minwidth=80)
         self.boundaries_tree.column('End Row', width=120, minwidth=80)
         
-        # Configure accessible colors
-        style = ttk.Style()
-        style.configure('Accessible.Treeview',
-                       background=self.colors['background'],
-                       foreground=self.colors['text'],
-                       selectbackground=self.colors['primary'],
-                       selectforeground=self.colors['background'],
-                       font=('Arial', 10))
-        
-        style.configure('Accessible.Treeview.Heading',
-                       background=self.colors['secondary'],
-                       foreground='#000000',  # Black text for header readability
-                       font=('Arial', 11, 'bold'))
-        
+        # Accessible colors come from the styles defined in _configure_styles
         self.boundaries_tree.configure(style='Accessible.Treeview')
         
-        # Add scrollbars with accessible styling
+        # Add scrollbars with accessible styling. Horizontal drags fire
+        # once per pixel and each xview call repaints every column, so
+        # coalesce bursts down to one repaint per idle tick
+        self._xview_after = None
+        self._xview_args = None
+
+        def throttled_xview(*args):
+            self._xview_args = args
+            if self._xview_after is None:
+                self._xview_after = self.root.after_idle(self._apply_xview)
+
         v_scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.boundaries_tree.yview)
-        h_scrollbar = ttk.Scrollbar(table_frame, orient=tk.HORIZONTAL, command=self.boundaries_tree.xview)
+        h_scrollbar = ttk.Scrollbar(table_frame, orient=tk.HORIZONTAL, command=throttled_xview)
         self.boundaries_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
         
         # Grid the treeview and scrollbars
@@ -940,10 +1068,10 @@ For additional assistance, contact your system administrator."""
         # Add to tab order and configure accessible events
         self.add_to_tab_order(self.boundaries_tree)
         
-        # Bind accessible navigation
+        # Bind accessible navigation - one key handler filtering on keysym
+        # instead of separate <Return>/<space> binding-table entries
         self.boundaries_tree.bind('<Double-1>', self.edit_boundary)
-        self.boundaries_tree.bind('<Return>', self.edit_boundary)
-        self.boundaries_tree.bind('<space>', self.edit_boundary)
+        self.boundaries_tree.bind('<Key>', self._on_tree_key)
         
         # Buttons frame with accessible layout
         buttons_frame = ttk.Frame(parent)
@@ -1024,14 +1152,12 @@ For additional assistance, contact your system administrator."""
                                   font=('Arial', 11, 'bold'))
         progress_label.pack(side=tk.LEFT, padx=(0, 10))
         
-        self.progress_var = tk.DoubleVar()
-        self.progress_bar = ttk.Progressbar(progress_frame, variable=self.progress_var, 
+        self.progress_bar = ttk.Progressbar(progress_frame, variable=self.progress_var,
                                           maximum=100, length=400, mode='determinate')
         self.progress_bar.pack(side=tk.LEFT, padx=(0, 15))
         self.add_to_tab_order(self.progress_bar)
         
         # Status label with high visibility
-        self.status_var = tk.StringVar(value="Ready to begin")
         status_label = ttk.Label(progress_frame, textvariable=self.status_var,
                                 style='Accessible.TLabel',
                                 font=('Arial', 11, 'bold'))
@@ -1074,7 +1200,12 @@ For additional assistance, contact your system administrator."""
     
     def update_button_states(self):
         """Update button states and colors based on data availability"""
-        
+
+        # Nothing to update until the deferred control section exists;
+        # create_control_section re-runs this once the buttons are real
+        if not self._sections_built:
+            return
+
         # Check if we have input file and data loaded
         has_input_file = bool(self.input_file_path.get())
         has_output_file = bool(self.output_file_path.get())
@@ -1085,41 +1216,17 @@ For additional assistance, contact your system administrator."""
         if has_input_file and has_output_file and has_data:
             # Data is ready - make button prominent
             self.run_button.configure(state='normal', style='Success.TButton')
-            self.status_var.set("Ready to run audit process")
+            self._set_status("Ready to run audit process")
             self.announce_to_screen_reader("System ready - all data loaded")
         elif has_input_file and has_output_file:
-            # Files selected but no data - use warning style
-            style = ttk.Style()
-            style.configure('Warning.TButton',
-                           foreground='#FFFFFF',  # White text
-                           background=self.colors['warning'],
-                           font=('Arial', 12, 'bold'),
-                           focuscolor=self.colors['accent'],
-                           borderwidth=2,
-                           relief='raised')
-            style.map('Warning.TButton',
-                     background=[('active', self.colors['secondary']),
-                               ('pressed', self.colors['accent'])],
-                     foreground=[('active', '#FFFFFF'),
-                               ('pressed', '#FFFFFF')])
+            # Files selected but no data - use warning style (defined once
+            # in create_widgets)
             self.run_button.configure(state='normal', style='Warning.TButton')
-            self.status_var.set("Load data first, then run audit")
+            self._set_status("Load data first, then run audit")
         else:
             # Missing files - disabled state
-            style = ttk.Style()
-            style.configure('Disabled.TButton',
-                           foreground='#FFFFFF',  # White text even when disabled
-                           background=self.colors['border'],
-                           font=('Arial', 12, 'bold'),
-                           borderwidth=2,
-                           relief='raised')
-            style.map('Disabled.TButton',
-                     background=[('active', self.colors['border']),
-                               ('pressed', self.colors['border'])],
-                     foreground=[('active', '#FFFFFF'),
-                               ('pressed', '#FFFFFF')])
             self.run_button.configure(state='disabled', style='Disabled.TButton')
-            self.status_var.set("Select input and output files first")
+            self._set_status("Select input and output files first")
         
         # Configure export button
         if has_results:
@@ -1175,30 +1282,52 @@ For additional assistance, contact your system administrator."""
                                        foreground=self.colors['primary'], 
                                        font=('Consolas', 11))
         
-        # Add welcome message with accessibility information
-        self.log_message("♿ Welcome to the ADA Compliant PADC Processor!", 'success')
-        self.log_message("🔧 Updated with McClellan (CM) and Sac Youth Center (SYC) consolidation", 'info')
+        # Add welcome message with accessibility information. The banner is
+        # written with a single insert plus one tag_add per line instead of
+        # ~20 log_message calls, each of which schedules its own
+        # insert/see/redraw round-trip.
+        banner_lines = [
+            ("♿ Welcome to the ADA Compliant PADC Processor!", 'success'),
+            ("🔧 Updated with McClellan (CM) and Sac Youth Center (SYC) consolidation", 'info'),
+        ]
         if DASHBOARD_AVAILABLE:
-            self.log_message("📈 ADA Dashboard feature available for CSV generation", 'info')
-        self.log_message("� Table sorting feature: Click column headers or use F2-F5 keys", 'info')
-        self.log_message("�📋 Step-by-step process:", 'info')
-        self.log_message("   1. Select your input attendance file and output audit file", 'info')
-        self.log_message("   2. Click 'Load & Analyze Data' to detect program boundaries", 'info')
-        self.log_message("   3. Review and edit boundaries if needed (sortable table)", 'info')
-        self.log_message("   4. Click 'Run Audit Process' to execute the full audit with consolidation", 'info')
+            banner_lines.append(("📈 ADA Dashboard feature available for CSV generation", 'info'))
+        banner_lines += [
+            ("� Table sorting feature: Click column headers or use F2-F5 keys", 'info'),
+            ("�📋 Step-by-step process:", 'info'),
+            ("   1. Select your input attendance file and output audit file", 'info'),
+            ("   2. Click 'Load & Analyze Data' to detect program boundaries", 'info'),
+            ("   3. Review and edit boundaries if needed (sortable table)", 'info'),
+            ("   4. Click 'Run Audit Process' to execute the full audit with consolidation", 'info'),
+        ]
         if DASHBOARD_AVAILABLE:
-            self.log_message("   5. Click 'Run ADA Dashboard' to generate CSV dashboard (optional)", 'info')
-        self.log_message("", 'info')
-        self.log_message("🎯 Accessibility Features Active:", 'success')
-        self.log_message("   • Press F1 for help and keyboard shortcuts", 'info')
-        self.log_message("   • Use Tab to navigate between elements", 'info')
-        self.log_message("   • Mouse wheel or Ctrl+Up/Down to scroll", 'info')
-        self.log_message("   • Page Up/Down for page navigation", 'info')
-        self.log_message("   • Ctrl+Home/End for quick navigation", 'info')
-        self.log_message("   • F2-F5 keys for table sorting", 'info')
-        self.log_message("   • High contrast colors for better visibility", 'info')
-        self.log_message("   • Screen reader compatible interface", 'info')
-        self.log_message("=" * 60, 'info')
+            banner_lines.append(("   5. Click 'Run ADA Dashboard' to generate CSV dashboard (optional)", 'info'))
+        banner_lines += [
+            ("", 'info'),
+            ("🎯 Accessibility Features Active:", 'success'),
+            ("   • Press F1 for help and keyboard shortcuts", 'info'),
+            ("   • Use Tab to navigate between elements", 'info'),
+            ("   • Mouse wheel or Ctrl+Up/Down to scroll", 'info'),
+            ("   • Page Up/Down for page navigation", 'info'),
+            ("   • Ctrl+Home/End for quick navigation", 'info'),
+            ("   • F2-F5 keys for table sorting", 'info'),
+            ("   • High contrast colors for better visibility", 'info'),
+            ("   • Screen reader compatible interface", 'info'),
+            ("=" * 60, 'info'),
+        ]
+
+        timestamp = time.strftime("%H:%M:%S")
+        icons = {'success': '✅', 'info': 'ℹ️'}
+        banner_text = []
+        tag_ranges = []
+        for line_number, (text, tag) in enumerate(banner_lines, start=1):
+            banner_text.append(f"[{timestamp}] {icons[tag]} {text}\n")
+            tag_ranges.append((tag, f"{line_number}.0", f"{line_number}.end"))
+
+        self.results_text.insert(tk.END, "".join(banner_text))
+        for tag, start_index, end_index in tag_ranges:
+            self.results_text.tag_add(tag, start_index, end_index)
+        self.results_text.see(tk.END)
     
     def set_default_paths(self):
         """Set default file paths by finding the most recent files"""
@@ -1207,19 +1336,32 @@ For additional assistance, contact your system administrator."""
         downloads_dir = Path("C:\\Users\\Shawn\\Downloads")
         
         if downloads_dir.exists():
-            # Find all attendance summary files
-            attendance_files = list(downloads_dir.glob("PrintMonthlyAttendanceSummaryTotals_*.xlsx"))
-            
-            if attendance_files:
-                # Get the most recent file by modification time
-                most_recent_input = max(attendance_files, key=lambda f: f.stat().st_mtime)
-                self.input_file_path.set(str(most_recent_input))
-                self.log_message(f"Auto-selected most recent input file: {most_recent_input.name}", 'info')
-        
+            # Track the most recent attendance summary file in one scandir
+            # pass: the directory entries carry cached stat results, so this
+            # avoids a second stat syscall per file and an intermediate list
+            most_recent_path = None
+            most_recent_name = None
+            most_recent_mtime = -1.0
+            with os.scandir(downloads_dir) as entries:
+                for entry in entries:
+                    if (entry.name.startswith("PrintMonthlyAttendanceSummaryTotals_")
+                            and entry.name.endswith(".xlsx")):
+                        mtime = entry.stat().st_mtime
+                        if mtime > most_recent_mtime:
+                            most_recent_mtime = mtime
+                            most_recent_path = entry.path
+                            most_recent_name = entry.name
+
+            if most_recent_path is not None:
+                self.input_file_path.set(most_recent_path)
+                self._input_path = Path(most_recent_path)
+                self.log_message(f"Auto-selected most recent input file: {most_recent_name}", 'info')
+
         # Default output path from original script
-        default_output = "C:\\Users\\Shawn\\Downloads\\2025-2026_I4C_ADA_Reconciliation.xlsx"
-        if Path(default_output).exists():
-            self.output_file_path.set(default_output)
+        default_output = Path("C:\\Users\\Shawn\\Downloads\\2025-2026_I4C_ADA_Reconciliation.xlsx")
+        if default_output.exists():
+            self.output_file_path.set(str(default_output))
+            self._output_path = default_output
     
     def browse_input_file(self):
         """Browse for input attendance file with accessibility features"""
@@ -1229,7 +1371,8 @@ For additional assistance, contact your system administrator."""
         )
         if filename:
             self.input_file_path.set(filename)
-            self.log_message(f"Input file selected: {Path(filename).name}", 'success')
+            self._input_path = Path(filename)
+            self.log_message(f"Input file selected: {self._input_path.name}", 'success')
             self.update_button_states()
             self.announce_to_screen_reader("Input file selected")
     
@@ -1242,137 +1385,374 @@ For additional assistance, contact your system administrator."""
         )
         if filename:
             self.output_file_path.set(filename)
-            self.log_message(f"Output file selected: {Path(filename).name}", 'success')
+            self._output_path = Path(filename)
+            self.log_message(f"Output file selected: {self._output_path.name}", 'success')
             self.update_button_states()
             self.announce_to_screen_reader("Output file selected")
     
     def load_and_analyze_data(self):
         """Load data and analyze program boundaries"""
-        
+
         if not self.input_file_path.get():
             messagebox.showerror("Error", "Please select an input file first.")
             return
-        
-        if not Path(self.input_file_path.get()).exists():
+
+        # Reuse the cached Path unless the entry text was edited by hand
+        input_path = self._input_path
+        if input_path is None or str(input_path) != self.input_file_path.get():
+            input_path = self._input_path = Path(self.input_file_path.get())
+
+        if not input_path.exists():
             messagebox.showerror("Error", "Input file does not exist.")
             return
-        
+
+        self._set_status("Loading data...")
+        self._set_progress(20)
+        self.log_message(f"Loading data from: {self.input_file_path.get()}")
+
+        # Keep the run button out of reach until the load settles;
+        # update_button_states re-enables it when the data is in
+        if self._sections_built:
+            self.run_button.configure(state='disabled')
+
+        # Parse the workbook off the Tk thread so the GUI keeps redrawing
+        # during the (potentially long) Excel read
+        self._task_executor.submit(self._load_worker, self.input_file_path.get())
+
+    def _load_worker(self, input_path):
+        """Worker thread: parse the workbook, scan boundaries, queue results.
+
+        The boundary scan is a full pass over the DataFrame, so it runs
+        here too; only the (cheap) state updates happen on the Tk thread."""
+
         try:
-            self.status_var.set("Loading data...")
-            self.progress_var.set(20)
-            self.root.update()
-            
-            # Load the Excel data
-            self.log_message(f"Loading data from: {self.input_file_path.get()}")
-            self.student_attendance_data = pd.read_excel(self.input_file_path.get(), header=None)
-            
-            self.progress_var.set(40)
-            self.root.update()
-            
-            # Find program boundaries
-            self.log_message("Analyzing program boundaries...")
-            self.find_program_boundaries()
-            
-            self.progress_var.set(60)
-            self.root.update()
-            
-            # Adjust boundaries
-            self.log_message("Adjusting boundaries to prevent overlaps...")
-            self.adjust_program_boundaries()
-            
-            self.progress_var.set(80)
-            self.root.update()
-            
+            # Deferred import: this is where pandas/openpyxl first load,
+            # safely off the Tk thread
+            from ADA_Audit_25_26_IMPROVED import (
+                load_student_attendance_data,
+                scan_all_boundaries
+            )
+
+            student_data = load_student_attendance_data(input_path)
+
+            # Boundaries are a pure function of the workbook bytes, so reuse
+            # a cached result when the same file was analyzed before
+            cache_file = self.settings_directory / f"cache_{self._input_fingerprint(input_path)}.json"
+            boundaries = None
+            if cache_file.exists():
+                try:
+                    boundaries = _json_loads(cache_file.read_bytes())
+                except Exception:
+                    boundaries = None
+
+            from_cache = boundaries is not None
+            if not from_cache:
+                self.log_message("Analyzing program boundaries...")
+                boundaries = scan_all_boundaries(
+                    student_data, self.program_name_mappings, self._program_name_set
+                )
+
+            self._io_queue.put(
+                ("load_done", (input_path, student_data, boundaries, from_cache, cache_file))
+            )
+        except Exception as e:
+            self._io_queue.put(("load_error", str(e)))
+
+    def _drain_io_queue(self):
+        """Apply pending worker results on the Tk thread (polled via after)"""
+
+        try:
+            while True:
+                kind, payload = self._io_queue.get_nowait()
+                if kind == "load_done":
+                    self._finish_load_and_analyze(*payload)
+                elif kind == "load_error":
+                    self._handle_load_error(payload)
+        except queue.Empty:
+            pass
+        finally:
+            self.root.after(50, self._drain_io_queue)
+
+    def _on_close(self):
+        """Shut the worker down without waiting and close the window"""
+        self._task_executor.shutdown(wait=False)
+        self.root.destroy()
+
+    def _finish_load_and_analyze(self, input_path, student_data, boundaries,
+                                 from_cache, cache_file):
+        """Apply worker results to GUI state (GUI thread only).
+
+        The heavy lifting - workbook parse and boundary scan - already
+        happened in _load_worker; what's left is cheap state bookkeeping."""
+
+        try:
+            self.student_attendance_data = student_data
+            self._set_progress(40)
+
+            self.program_boundaries = boundaries
+
+            for short_code, bounds in self.program_boundaries.items():
+                self.log_message(f"Found {short_code}: Start={bounds['start']}, End={bounds['stop']}")
+
+            if from_cache:
+                self.log_message("📁 Using cached program boundaries for this input file")
+                self._set_progress(80)
+            else:
+                self._set_progress(60)
+
+                # Adjust boundaries (small in-memory fixup over the
+                # boundary array, fine on the Tk thread)
+                self.log_message("Adjusting boundaries to prevent overlaps...")
+                self.adjust_program_boundaries()
+
+                self._set_progress(80)
+
+                # Cache the analysis for the next load of this same file
+                try:
+                    with open(cache_file, 'wb', buffering=1 << 20) as f:
+                        f.write(_json_dumps_pretty(self.program_boundaries))
+                except Exception as e:
+                    self.log_message(f"⚠️ Could not cache boundary analysis: {e}", 'warning')
+
             # Update the display
             self.update_boundaries_display()
-            
-            self.progress_var.set(100)
-            self.status_var.set("Data loaded and analyzed")
+
+            self._set_progress(100)
+            self._set_status("Data loaded and analyzed")
             self.log_message("Data analysis complete! Review boundaries above.", 'success')
             self.update_button_states()
             self.announce_to_screen_reader("Data analysis completed successfully")
-            
+
         except Exception as e:
-            self.log_message(f"Error loading data: {str(e)}", 'error')
-            self.status_var.set("Error loading data")
-            self.announce_to_screen_reader(f"Error: {str(e)}")
-            messagebox.showerror("Error", f"Failed to load data: {str(e)}")
+            self._handle_load_error(str(e))
         finally:
-            self.progress_var.set(0)
-    
-    def find_program_boundaries(self):
-        """Find boundaries for each program"""
-        
-        for full_program_name, short_code in self.program_name_mappings.items():
-            matching_rows = find_rows_containing_program_name(self.student_attendance_data, full_program_name)
-            start_row, end_row = find_program_boundary_rows(matching_rows)
-            self.program_boundaries[short_code]["start"] = start_row
-            self.program_boundaries[short_code]["stop"] = end_row
-            
-            self.log_message(f"Found {short_code}: Start={start_row}, End={end_row}")
+            self._set_progress(0)
+
+    def _set_progress(self, value):
+        """Write the progress bar, throttled to ~10 Hz.
+
+        High-frequency callers (per-row extraction callbacks) would
+        otherwise queue a redraw per call; endpoints (0 and 100) always
+        land so the bar never sticks mid-run. Unchanged values are
+        skipped entirely - no Tk variable notification at all."""
+        if value == self._last_progress_value:
+            return
+        now = time.monotonic()
+        if 0 < value < 100 and now - self._last_progress_ts < 0.1:
+            return
+        self._last_progress_ts = now
+        self._last_progress_value = value
+        self.progress_var.set(value)
+
+    def _set_status(self, text):
+        """Write the status line, skipping writes that wouldn't change it.
+
+        update_button_states re-derives the status on every keystroke in
+        the file-path entries; most of those writes repeat the previous
+        text and would still fire Tk variable observers."""
+        if text != self._last_status_text:
+            self._last_status_text = text
+            self.status_var.set(text)
+
+    def _handle_load_error(self, error_msg):
+        """Report a failed load on the Tk thread"""
+
+        self.log_message(f"Error loading data: {error_msg}", 'error')
+        self._set_status("Error loading data")
+        self._set_progress(0)
+        self.update_button_states()
+        self.announce_to_screen_reader(f"Error: {error_msg}")
+        messagebox.showerror("Error", f"Failed to load data: {error_msg}")
     
+    def _rebuild_mapping_indexes(self):
+        """Rebuild lookup structures derived from the program mappings.
+
+        Called once from __init__ and again whenever the mappings change
+        (e.g. after importing settings)."""
+
+        self._program_name_set = frozenset(self.program_name_mappings)
+        self._short_to_full = {
+            short: full for full, short in self.program_name_mappings.items()
+        }
+        self._consolidation_children = tuple(
+            (parent, tuple(children))
+            for parent, children in self.program_consolidation_rules.items()
+        )
+
+        # Every "{code}_Month_{month}_{age}: " key the consolidation can
+        # touch, formatted once; the hot loop then only does dict lookups
+        age_groups = ("TK-3", "4-6", "7-8", "9-12")
+        codes = set(self.program_name_mappings.values())
+        for parent, children in self._consolidation_children:
+            codes.add(parent)
+            codes.update(children)
+        self._field_names = {
+            (code, month, age): f"{code}_Month_{month}_{age}: "
+            for code in codes
+            for month in range(1, 13)
+            for age in age_groups
+        }
+
+    @staticmethod
+    def _int_or_none(value):
+        """Canonical numeric sort key: an int, or None for "Not found"."""
+        try:
+            return int(value)
+        except (ValueError, TypeError):
+            return None
+
+    @staticmethod
+    def _clone_boundaries(boundaries):
+        """Copy a boundaries dict cheaply - the structure is small and flat,
+        so a comprehension beats copy.deepcopy's generic memo machinery"""
+
+        return {
+            short_code: {"start": bounds.get("start"), "stop": bounds.get("stop")}
+            for short_code, bounds in boundaries.items()
+        }
+
+    @property
+    def program_boundaries(self):
+        """Dict view ({code: {"start", "stop"}}) over the boundary array"""
+
+        return {
+            short_code: {
+                "start": int(self._boundaries[row, 0]) if self._boundaries[row, 0] >= 0 else None,
+                "stop": int(self._boundaries[row, 1]) if self._boundaries[row, 1] >= 0 else None,
+            }
+            for short_code, row in self._code_index.items()
+        }
+
+    @program_boundaries.setter
+    def program_boundaries(self, boundaries):
+        """Load a boundaries dict (from analysis, cache or import) into the array"""
+
+        self._code_index = {code: i for i, code in enumerate(boundaries)}
+        self._boundaries = np.full((len(self._code_index), 2), -1, dtype=np.int32)
+        for short_code, bounds in boundaries.items():
+            self.set_program_boundary(short_code, bounds.get("start"), bounds.get("stop"))
+
+    def set_program_boundary(self, short_code, start, stop):
+        """Store one program's boundaries (None clears a value)"""
+
+        row = self._code_index[short_code]
+        self._boundaries[row, 0] = -1 if start is None else start
+        self._boundaries[row, 1] = -1 if stop is None else stop
+
+    def _input_fingerprint(self, file_path):
+        """Build a cache key from the input file's size, mtime and leading bytes"""
+
+        file_stat = os.stat(file_path)
+        with open(file_path, 'rb') as f:
+            leading_bytes = f.read(65536)
+
+        digest = hashlib.sha1(leading_bytes).hexdigest()
+        return f"{digest}_{file_stat.st_size}_{file_stat.st_mtime_ns}"
+
+    def _month_rows_for_input(self):
+        """Month -> row-number lists for the loaded data, cached per file.
+
+        Month rows only matter inside the program boundaries, so the scan
+        runs over a slice from the first found start to the last found
+        stop instead of the whole sheet (headers/footers excluded). Keyed
+        by (path, mtime, window) so running the audit twice on the same
+        unchanged workbook skips the column scan entirely."""
+
+        from ADA_Audit_25_26_IMPROVED import find_rows_for_all_months
+
+        # Boundary extent as 1-based row numbers; fall back to the full
+        # sheet if no boundaries were found
+        starts = self._boundaries[:, 0]
+        stops = self._boundaries[:, 1]
+        if (starts >= 0).any() and (stops >= 0).any():
+            lo = int(starts[starts >= 0].min())
+            hi = int(stops[stops >= 0].max())
+        else:
+            lo, hi = 1, len(self.student_attendance_data)
+
+        path = self.input_file_path.get()
+        try:
+            key = (path, os.path.getmtime(path), lo, hi)
+        except OSError:
+            key = None
+
+        if key is not None and self._month_rows_cache.get('key') == key:
+            return self._month_rows_cache['rows']
+
+        window = self.student_attendance_data.iloc[lo - 1:hi]
+        rows_by_month = find_rows_for_all_months(window)
+
+        # Row numbers come back relative to the window; shift them back to
+        # whole-sheet 1-based numbers
+        offset = lo - 1
+        if offset:
+            rows_by_month = {
+                month: [row + offset for row in rows]
+                for month, rows in rows_by_month.items()
+            }
+
+        self._month_rows_cache = {'key': key, 'rows': rows_by_month}
+        return rows_by_month
+
     def adjust_program_boundaries(self):
         """Adjust boundaries to prevent overlaps (from original script logic)"""
-        
-        # Fix Program C boundaries
-        prog_C_tk_start = self.program_boundaries["Prog_C_TK"]["start"]
-        prog_N_start = self.program_boundaries["Prog_N"]["start"]
 
-        if prog_C_tk_start is not None and prog_N_start is not None:
-            self.program_boundaries["Prog_C"]["stop"] = prog_C_tk_start - 1
+        index = self._code_index
+        bounds = self._boundaries  # columns: [start, stop]; -1 = not found
 
-        if prog_N_start is not None:
-            self.program_boundaries["Prog_C_TK"]["stop"] = prog_N_start - 1
+        # The programs appear in this fixed order in the sheet, and every
+        # adjustment is the same adjacency rule: a program's data ends one
+        # row above where the next found program starts. The old hand-coded
+        # Prog_C / Prog_N sections were degenerate cases of this same rule.
+        order = ("Prog_C", "Prog_C_TK", "Prog_N", "Prog_N_TK", "Prog_J", "Prog_K")
+        rows = np.array([index[code] for code in order])
+        starts = bounds[rows, 0]
 
-        # Fix Program N boundaries
-        prog_N_tk_start = self.program_boundaries["Prog_N_TK"]["start"]
-        if prog_N_tk_start is not None:
-            self.program_boundaries["Prog_N"]["stop"] = prog_N_tk_start - 1
-
-        # Fix remaining program boundaries
-        programs_to_adjust = ["Prog_N_TK", "Prog_J", "Prog_K"]
-        for i in range(len(programs_to_adjust) - 1):
-            current_program = programs_to_adjust[i]
-            next_program = programs_to_adjust[i + 1]
-            
-            current_start = self.program_boundaries[current_program]["start"]
-            next_start = self.program_boundaries[next_program]["start"]
-            
-            if current_start is not None and next_start is not None:
-                self.program_boundaries[current_program]["stop"] = next_start - 1
+        # Branchless: one mask selects the adjacent pairs where both
+        # programs were found, then all stops are written in one shot
+        pair = (starts[:-1] >= 0) & (starts[1:] >= 0)
+        bounds[rows[:-1][pair], 1] = starts[1:][pair] - 1
     
     def update_boundaries_display(self):
         """Update the boundaries table display"""
         
         # Debug logging
         self.log_message(f"🔄 Updating boundaries display...")
-        
-        # Clear existing items
-        for item in self.boundaries_tree.get_children():
-            self.boundaries_tree.delete(item)
-        
+
+        # No clear here: populate_tree_from_data owns the (bulk) clear, and
+        # apply_sort falls back to it whenever the row set changed
+
         # Prepare boundary data for display and sorting
         self.boundary_data = []
+        self.boundary_rows = {}
         items_added = 0
-        
+
         for short_code, boundaries in self.program_boundaries.items():
-            # Find the full program name
-            full_name = "Unknown"
-            for full, short in self.program_name_mappings.items():
-                if short == short_code:
-                    full_name = full
-                    break
-            
+            # Find the full program name via the reverse index (rebuilt
+            # whenever the mappings change) instead of a linear scan per row
+            full_name = self._short_to_full.get(short_code, "Unknown")
+
             start = boundaries.get("start", "Not found")
             stop = boundaries.get("stop", "Not found")
-            
-            # Store data for sorting
-            self.boundary_data.append({
+
+            # Store data for sorting; boundary_rows keys the same dicts by
+            # iid so handlers never read cell values back out of Tcl.
+            # _sort_keys holds each column's canonical comparison value so
+            # apply_sort never re-parses "Not found"/int per comparison
+            row = {
                 'Program Code': short_code,
                 'Program Name': full_name,
                 'Start Row': start,
-                'End Row': stop
-            })
+                'End Row': stop,
+                '_sort_keys': {
+                    'Program Code': str(short_code).lower(),
+                    'Program Name': full_name.lower(),
+                    'Start Row': self._int_or_none(start),
+                    'End Row': self._int_or_none(stop)
+                }
+            }
+            self.boundary_data.append(row)
+            self.boundary_rows[short_code] = row
             
             items_added += 1
             
@@ -1382,6 +1762,15 @@ For additional assistance, contact your system administrator."""
         
         # Apply current sort if any
         if self.sort_column:
+            # When the row set is unchanged, refresh cell values in place
+            # so apply_sort's move() path never shows stale numbers; a
+            # changed row set makes apply_sort rebuild via populate anyway
+            if set(self.boundaries_tree.get_children()) == set(self.boundary_rows):
+                for short_code, row in self.boundary_rows.items():
+                    self.boundaries_tree.item(short_code, values=(
+                        row['Program Code'], row['Program Name'],
+                        row['Start Row'], row['End Row']
+                    ))
             self.apply_sort()
         else:
             # No sort applied, just populate in original order
@@ -1389,6 +1778,36 @@ For additional assistance, contact your system administrator."""
         
         self.log_message(f"✅ Added {items_added} boundary entries to display")
     
+    def _refresh_boundary_row(self, program_code):
+        """Update a single edited row in the model and the tree in place.
+
+        Editing one boundary used to rebuild boundary_data and repopulate
+        the whole tree; this touches only the affected row and re-sorts
+        only when the edited columns drive the current sort."""
+
+        row = self.boundary_rows.get(program_code)
+        if row is None:
+            # Row set changed out from under us - fall back to a full rebuild
+            self.update_boundaries_display()
+            return
+
+        index = self._code_index[program_code]
+        start = int(self._boundaries[index, 0]) if self._boundaries[index, 0] >= 0 else None
+        stop = int(self._boundaries[index, 1]) if self._boundaries[index, 1] >= 0 else None
+
+        row['Start Row'] = start
+        row['End Row'] = stop
+        row['_sort_keys']['Start Row'] = self._int_or_none(start)
+        row['_sort_keys']['End Row'] = self._int_or_none(stop)
+
+        self.boundaries_tree.item(program_code, values=(
+            row['Program Code'], row['Program Name'], start, stop
+        ))
+
+        # Only the row columns can change here, so other sort orders hold
+        if self.sort_column in ('Start Row', 'End Row'):
+            self.apply_sort()
+
     def sort_table(self, column):
         """Sort the table by the specified column"""
         
@@ -1415,47 +1834,63 @@ For additional assistance, contact your system administrator."""
         
         if not self.sort_column or not self.boundary_data:
             return
-        
-        # Define sort key function
-        def sort_key(item):
-            value = item[self.sort_column]
-            
-            # Handle numeric values for row numbers
-            if self.sort_column in ['Start Row', 'End Row']:
-                if value == "Not found" or value is None:
-                    return float('inf') if not self.sort_reverse else float('-inf')
-                try:
-                    return int(value)
-                except (ValueError, TypeError):
-                    return float('inf') if not self.sort_reverse else float('-inf')
-            
-            # Handle text values
-            if value is None or value == "Not found":
-                return "zzz" if not self.sort_reverse else ""
-            
-            return str(value).lower()
-        
-        # Sort the data
-        self.boundary_data.sort(key=sort_key, reverse=self.sort_reverse)
-        
-        # Repopulate the tree
-        self.populate_tree_from_data()
+
+        # Keys were canonicalized when the rows were built, so sorting is a
+        # plain dict lookup per row - no int()/"Not found" parsing inside
+        # the comparison loop. Rows with no value for this column (key is
+        # None) stay at the bottom in both directions, as before.
+        column = self.sort_column
+        decorated = []
+        missing = []
+        for row in self.boundary_data:
+            key = row['_sort_keys'][column]
+            if key is None:
+                missing.append(row)
+            else:
+                decorated.append((key, row))
+        # Decorate-sort-undecorate with a C-level itemgetter key: no Python
+        # frame per comparison
+        decorated.sort(key=itemgetter(0), reverse=self.sort_reverse)
+        self.boundary_data = [row for _, row in decorated] + missing
+
+        # Reorder the existing rows in place when possible: rows are keyed
+        # by program code (iid), so move() is cheap per row and triggers one
+        # redraw, unlike delete+insert which destroys and rebuilds every item
+        existing_iids = set(self.boundaries_tree.get_children())
+
+        if existing_iids == {data['Program Code'] for data in self.boundary_data}:
+            for index, data in enumerate(self.boundary_data):
+                self.boundaries_tree.move(data['Program Code'], '', index)
+        else:
+            # Row set changed (or codes collide) - fall back to a rebuild
+            self.populate_tree_from_data()
     
     def populate_tree_from_data(self):
         """Populate the tree view from the sorted boundary data"""
-        
-        # Clear existing items
-        for item in self.boundaries_tree.get_children():
-            self.boundaries_tree.delete(item)
-        
-        # Add sorted data to tree
-        for data in self.boundary_data:
-            self.boundaries_tree.insert('', tk.END, values=(
-                data['Program Code'],
-                data['Program Name'], 
-                data['Start Row'],
-                data['End Row']
-            ))
+
+        # Unmap the tree while rebuilding so the clear and the inserts are
+        # painted in one pass instead of a redraw per row; grid_remove keeps
+        # the grid options so grid() restores it in place
+        self.boundaries_tree.grid_remove()
+        try:
+            # Clear existing items in one call so Tk schedules a single redraw
+            # instead of one per deleted row
+            children = self.boundaries_tree.get_children()
+            if children:
+                self.boundaries_tree.delete(*children)
+
+            # Add sorted data to tree; self.boundary_data stays the single
+            # model and rows are keyed by program code so sorting can move()
+            # them without ever querying cell values back out of Tk
+            for data in self.boundary_data:
+                self.boundaries_tree.insert('', tk.END, iid=data['Program Code'], values=(
+                    data['Program Code'],
+                    data['Program Name'],
+                    data['Start Row'],
+                    data['End Row']
+                ))
+        finally:
+            self.boundaries_tree.grid()
     
     def update_sort_indicators(self):
         """Update column headers to show current sort direction"""
@@ -1489,6 +1924,17 @@ For additional assistance, contact your system administrator."""
         self.log_message("🔄 Table sort reset to original order")
         self.announce_to_screen_reader("Table sort reset to original order")
     
+    def _apply_xview(self):
+        """Apply the most recent horizontal scroll request (trailing edge)"""
+        self._xview_after = None
+        if self._xview_args is not None:
+            self.boundaries_tree.xview(*self._xview_args)
+
+    def _on_tree_key(self, event):
+        """Dispatch Return/space key presses on the tree to the boundary editor"""
+        if event.keysym in ('Return', 'space'):
+            self.edit_boundary(event)
+
     def edit_boundary(self, event):
         """Handle double-click to edit boundary"""
         self.edit_selected_boundary()
@@ -1501,12 +1947,19 @@ For additional assistance, contact your system administrator."""
             messagebox.showwarning("Warning", "Please select a program boundary to edit.")
             return
         
-        # Get selected item data
+        # Rows are keyed by program code, so the selection iid indexes the
+        # model directly - no round trip through Tcl for the cell values
         item = selection[0]
-        values = self.boundaries_tree.item(item, 'values')
-        program_code = values[0]
-        current_start = values[2]
-        current_end = values[3]
+        row = self.boundary_rows.get(item)
+        if row is not None:
+            program_code = row['Program Code']
+            current_start = row['Start Row']
+            current_end = row['End Row']
+        else:
+            values = self.boundaries_tree.item(item, 'values')
+            program_code = values[0]
+            current_start = values[2]
+            current_end = values[3]
         
         # Create edit dialog
         self.create_boundary_edit_dialog(program_code, current_start, current_end)
@@ -1559,11 +2012,10 @@ For additional assistance, contact your system administrator."""
                 end_val = None if end_var.get().strip() == "" else int(end_var.get())
                 
                 # Update the boundaries
-                self.program_boundaries[program_code]["start"] = start_val
-                self.program_boundaries[program_code]["stop"] = end_val
-                
-                # Update display
-                self.update_boundaries_display()
+                self.set_program_boundary(program_code, start_val, end_val)
+
+                # Update just the edited row in place
+                self._refresh_boundary_row(program_code)
                 
                 # Log the change
                 self.log_message(f"✅ Updated {program_code}: Start={start_val}, End={end_val}")
@@ -1599,39 +2051,47 @@ For additional assistance, contact your system administrator."""
         # Disable the run button to prevent multiple runs
         self.run_button.configure(state='disabled')
         
-        # Run in a separate thread to prevent GUI freezing
-        thread = threading.Thread(target=self.execute_audit_process, daemon=True)
-        thread.start()
+        # Run on the shared worker so the GUI never freezes
+        self._task_executor.submit(self.execute_audit_process)
     
     def execute_audit_process(self):
         """Execute the audit process in a separate thread"""
-        
+
+        from ADA_Audit_25_26_IMPROVED import (
+            extract_student_attendance_data,
+            write_all_attendance_data_to_excel_efficiently
+        )
+
         try:
-            self.status_var.set("Running audit process...")
+            self._set_status("Running audit process...")
             self.log_message("🚀 Starting audit process...")
             
-            # Step 1: Find month occurrences
-            self.progress_var.set(10)
+            # Step 1: Find month occurrences (single bucketing pass, cached
+            # per input file so re-runs skip the scan entirely)
+            self._set_progress(10)
             self.log_message("📅 Finding month occurrences...")
-            
-            monthly_attendance_by_program = {}
-            for month_number in range(1, 13):
-                rows_with_this_month = find_rows_containing_month_number(self.student_attendance_data, month_number)
-                monthly_attendance_by_program[month_number] = rows_with_this_month
+
+            monthly_attendance_by_program = self._month_rows_for_input()
+            for month_number, rows_with_this_month in monthly_attendance_by_program.items():
                 self.log_message(f"  Month {month_number}: Found in {len(rows_with_this_month)} rows")
             
-            self.progress_var.set(30)
+            self._set_progress(30)
             
             # Step 2: Extract attendance data
             self.log_message("📈 Extracting attendance data...")
             
+            def extraction_progress(rows_done, rows_total):
+                # Map extraction progress into the 30-40% band of the audit run
+                self._set_progress(30 + 10 * rows_done / max(rows_total, 1))
+
             raw_attendance_data = extract_student_attendance_data(
                 monthly_attendance_by_program,
                 self.program_boundaries,
-                self.student_attendance_data
+                self.student_attendance_data,
+                progress_cb=extraction_progress
             )
             
-            self.progress_var.set(40)
+            self._set_progress(40)
             self.log_message(f"✅ Extracted {len(raw_attendance_data)} raw attendance data points")
             
             # Step 3: Consolidate sub-location data with parent programs
@@ -1641,11 +2101,11 @@ For additional assistance, contact your system administrator."""
             
             self.extracted_attendance_data = self.consolidate_attendance_data(raw_attendance_data)
             
-            self.progress_var.set(60)
+            self._set_progress(60)
             self.log_message(f"✅ Consolidated {len(self.extracted_attendance_data)} attendance data points")
             
             # Step 4: Write to Excel
-            self.progress_var.set(80)
+            self._set_progress(80)
             self.log_message("💾 Writing consolidated data to Excel...")
             
             write_all_attendance_data_to_excel_efficiently(
@@ -1654,8 +2114,8 @@ For additional assistance, contact your system administrator."""
                 self.worksheet_name.get()
             )
             
-            self.progress_var.set(100)
-            self.status_var.set("Audit completed successfully")
+            self._set_progress(100)
+            self._set_status("Audit completed successfully")
             self.log_message("Audit process completed successfully!", 'success')
             self.log_message(f"Results saved to: {self.output_file_path.get()}", 'success')
             self.update_button_states()
@@ -1668,7 +2128,7 @@ For additional assistance, contact your system administrator."""
         except Exception as e:
             error_msg = str(e)
             self.log_message(f"Error during audit process: {error_msg}", 'error')
-            self.status_var.set("Error during audit process")
+            self._set_status("Error during audit process")
             self.announce_to_screen_reader(f"Audit failed: {error_msg}")
             self.root.after(0, lambda: messagebox.showerror("Error", f"Audit process failed: {error_msg}"))
         
@@ -1676,7 +2136,7 @@ For additional assistance, contact your system administrator."""
             # Re-enable the run button and update states
             self.root.after(0, lambda: self.run_button.configure(state='normal'))
             self.root.after(0, lambda: self.update_button_states())
-            self.root.after(0, lambda: self.progress_var.set(0))
+            self.root.after(0, lambda: self._set_progress(0))
     
     def consolidate_attendance_data(self, raw_attendance_data):
         """
@@ -1685,37 +2145,56 @@ For additional assistance, contact your system administrator."""
         This function combines McClellan (CM) and Sac Youth Center (SYC) data
         with their respective parent programs (C and N) as required for audit compliance.
         """
+        import pandas as pd
+
         consolidated_attendance_data = {}
-        
-        # Process each consolidation rule
-        for parent_program, child_programs in self.program_consolidation_rules.items():
-            self.log_message(f"  Consolidating {parent_program}: {child_programs}")
-            
-            # For each month (1-12) and age group combination
-            for month in range(1, 13):
-                for age_group in ["TK-3", "4-6", "7-8", "9-12"]:
-                    # Create the field name pattern
-                    field_pattern = f"{parent_program}_Month_{month}_{age_group}: "
-                    
-                    # Sum up values from all child programs
-                    total_value = 0
-                    found_values = []
-                    
-                    for child_program in child_programs:
-                        child_field_pattern = f"{child_program}_Month_{month}_{age_group}: "
-                        child_value = raw_attendance_data.get(child_field_pattern, 0)
-                        
-                        if child_value and not pd.isna(child_value) and child_value != 0:
-                            total_value += child_value
-                            found_values.append(f"{child_program}: {child_value}")
-                    
-                    # Store the consolidated value
-                    consolidated_attendance_data[field_pattern] = total_value
-                    
-                    # Log consolidation details for non-zero values
+
+        months = range(1, 13)
+        age_groups = ["TK-3", "4-6", "7-8", "9-12"]
+        field_names = [(month, age_group) for month in months for age_group in age_groups]
+
+        # Build one (children x fields) tensor up front: every raw value is
+        # pulled out of the dict exactly once, coerced to float in a single
+        # pandas pass, and NaN/None entries are normalized to 0
+        all_children = [child
+                        for _, child_programs in self._consolidation_children
+                        for child in child_programs]
+        child_index = {child: i for i, child in enumerate(all_children)}
+        values = [
+            raw_attendance_data.get(self._field_names[(child, month, age_group)], 0)
+            for child in all_children
+            for month, age_group in field_names
+        ]
+        raw = pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=float)
+        raw = np.nan_to_num(raw, copy=False).reshape(len(all_children), len(field_names))
+
+        # Process each consolidation rule (precomputed tuple, see __init__)
+        for parent_program, child_programs in self._consolidation_children:
+            self.log_message(f"  Consolidating {parent_program}: {list(child_programs)}")
+
+            # Parent totals are a single row-slice sum over the tensor
+            child_rows = [child_index[child] for child in child_programs]
+            totals = raw[child_rows].sum(axis=0)
+
+            for index, (month, age_group) in enumerate(field_names):
+                field_pattern = self._field_names[(parent_program, month, age_group)]
+                consolidated_attendance_data[field_pattern] = totals[index]
+
+            # Per-cell breakdown lines each schedule their own Tcl insert,
+            # so only emit them when verbose logging is on
+            if self.verbose_logging:
+                for index, (month, age_group) in enumerate(field_names):
+                    total_value = totals[index]
                     if total_value > 0:
-                        self.log_message(f"    {field_pattern} = {' + '.join(found_values)} = {total_value}")
-        
+                        found_values = [
+                            f"{child}: {raw[child_index[child], index]}"
+                            for child in child_programs
+                            if raw[child_index[child], index] != 0
+                        ]
+                        self.log_message(
+                            f"    {self._field_names[(parent_program, month, age_group)]} = "
+                            f"{' + '.join(found_values)} = {total_value}")
+
         return consolidated_attendance_data
     
     def increase_font_size(self):
@@ -1778,14 +2257,20 @@ For additional assistance, contact your system administrator."""
         
         if filename:
             try:
-                with open(filename, 'w') as f:
-                    f.write("ADA Audit Process - Consolidated Attendance Data\n")
-                    f.write("=" * 55 + "\n")
-                    f.write("Note: This data includes consolidation of McClellan (CM) and Sac Youth Center (SYC)\n")
-                    f.write("with their respective parent programs for audit compliance.\n\n")
-                    
-                    for field_name, attendance_value in self.extracted_attendance_data.items():
-                        f.write(f"{field_name}: {attendance_value}\n")
+                # Build the whole body in memory and write it once: ~576
+                # short per-line writes become a single buffered call
+                header = (
+                    "ADA Audit Process - Consolidated Attendance Data\n"
+                    + "=" * 55 + "\n"
+                    "Note: This data includes consolidation of McClellan (CM) and Sac Youth Center (SYC)\n"
+                    "with their respective parent programs for audit compliance.\n\n"
+                )
+                body = "\n".join(
+                    f"{field_name}: {attendance_value}"
+                    for field_name, attendance_value in self.extracted_attendance_data.items()
+                )
+                with open(filename, 'w', buffering=1 << 20) as f:
+                    f.write(header + body + "\n")
                 
                 self.log_message(f"✅ Results exported to: {filename}")
                 messagebox.showinfo("Success", f"Results exported to:\n{filename}")
@@ -1809,7 +2294,14 @@ For additional assistance, contact your system administrator."""
         if self.student_attendance_data is None:
             messagebox.showerror("Error", "Please load and analyze data first.")
             return
-        
+
+        # Deferred import: the dashboard module is only loaded once the
+        # user actually runs it
+        from ADA_Dashboard_Module import (
+            get_dashboard_configuration_from_user,
+            validate_boundaries_for_dashboard
+        )
+
         # Validate boundaries
         is_valid, message, is_warning = validate_boundaries_for_dashboard(self.program_boundaries)
         if not is_valid:
@@ -1836,24 +2328,24 @@ For additional assistance, contact your system administrator."""
             if hasattr(self, 'dashboard_button'):
                 self.dashboard_button.configure(state='disabled')
             
-            # Set up progress and logging callbacks
+            # Set up progress and logging callbacks. No root.update() here:
+            # the callback runs in the dashboard worker thread and the main
+            # loop repaints on its own once the variable changes; update()
+            # would re-entrantly pump the whole event queue
             def progress_callback(value):
-                self.progress_var.set(value)
-                self.root.update()
+                self._set_progress(value)
             
             def log_callback(message, msg_type='info'):
                 self.log_message(message, msg_type)
             
             # Set status
-            self.status_var.set("Running ADA Dashboard...")
+            self._set_status("Running ADA Dashboard...")
             
-            # Run dashboard in a separate thread to prevent GUI freezing
-            thread = threading.Thread(
-                target=self.execute_dashboard_process,
-                args=(school_year, location, school_name, progress_callback, log_callback),
-                daemon=True
+            # Run the dashboard on the shared worker so the GUI never freezes
+            self._task_executor.submit(
+                self.execute_dashboard_process,
+                school_year, location, school_name, progress_callback, log_callback
             )
-            thread.start()
             
         except Exception as e:
             self.log_message(f"❌ Error starting dashboard: {str(e)}", 'error')
@@ -1863,7 +2355,9 @@ For additional assistance, contact your system administrator."""
     
     def execute_dashboard_process(self, school_year, location, school_name, progress_callback, log_callback):
         """Execute the dashboard process in a separate thread"""
-        
+
+        from ADA_Dashboard_Module import run_ada_dashboard_with_boundaries
+
         try:
             # Create output directory for dashboard files
             output_dir = os.path.join(os.path.dirname(self.input_file_path.get()), "ADA_Dashboard_Output")
@@ -1891,7 +2385,7 @@ For additional assistance, contact your system administrator."""
                     message += f"Output file: {os.path.basename(results['csv_file'])}\n"
                     message += f"Location: {os.path.dirname(results['csv_file'])}"
                 
-                self.root.after(0, lambda: self.status_var.set("Dashboard completed successfully"))
+                self.root.after(0, lambda: self._set_status("Dashboard completed successfully"))
                 self.root.after(0, lambda: messagebox.showinfo("Dashboard Complete", message))
                 
                 # Open output directory
@@ -1904,19 +2398,19 @@ For additional assistance, contact your system administrator."""
                         
             else:
                 error_msg = results.get('message', 'Unknown error occurred')
-                self.root.after(0, lambda: self.status_var.set("Dashboard failed"))
+                self.root.after(0, lambda: self._set_status("Dashboard failed"))
                 self.root.after(0, lambda: messagebox.showerror("Dashboard Error", error_msg))
                 
         except Exception as e:
             error_msg = f"Dashboard process failed: {str(e)}"
             self.root.after(0, lambda: log_callback(error_msg, 'error'))
-            self.root.after(0, lambda: self.status_var.set("Dashboard failed"))
+            self.root.after(0, lambda: self._set_status("Dashboard failed"))
             self.root.after(0, lambda: messagebox.showerror("Dashboard Error", error_msg))
         
         finally:
             # Re-enable dashboard button and reset progress
             self.root.after(0, lambda: self.update_button_states())
-            self.root.after(0, lambda: self.progress_var.set(0))
+            self.root.after(0, lambda: self._set_progress(0))
     
     def log_message(self, message, message_type='info'):
         """Add a message to the results log with accessibility features"""
@@ -1938,48 +2432,138 @@ For additional assistance, contact your system administrator."""
         if message_type in ['success', 'error', 'warning']:
             self.announce_to_screen_reader(message)
         
-        # Use after() to ensure thread-safe GUI updates
-        self.root.after(0, lambda: self._append_to_log(formatted_message, message_type))
-    
-    def _append_to_log(self, message, message_type='info'):
-        """Append message to log with appropriate styling (GUI thread only)"""
-        
-        # Insert message with appropriate tag
-        start_pos = self.results_text.index(tk.END + "-1c")
-        self.results_text.insert(tk.END, message)
-        end_pos = self.results_text.index(tk.END + "-1c")
-        
-        # Apply styling tag
-        self.results_text.tag_add(message_type, start_pos, end_pos)
-        
-        # Auto-scroll to bottom
-        self.results_text.see(tk.END)
+        # Buffer the line; _flush_log drains the whole batch with one
+        # insert on the Tk thread (deque.append is atomic, so this is safe
+        # from worker threads too)
+        self._log_buffer.append((formatted_message, message_type))
+
+    def _flush_log(self):
+        """Drain buffered log lines into the Text widget (100ms timer).
+
+        A chatty run can emit hundreds of lines in a burst; writing them
+        as one insert plus a tag_add per line replaces an insert/tag/see
+        Tcl round trip for every single message."""
+
+        try:
+            if self._log_buffer and self._sections_built:
+                batch = []
+                while self._log_buffer:
+                    batch.append(self._log_buffer.popleft())
+
+                line = int(self.results_text.index(tk.END + "-1c").split('.')[0])
+                self.results_text.insert(tk.END, "".join(message for message, _ in batch))
+                for message, message_type in batch:
+                    line_count = message.count('\n') or 1
+                    self.results_text.tag_add(
+                        message_type, f"{line}.0", f"{line + line_count - 1}.end")
+                    line += line_count
+
+                # One scroll per flush, not per line
+                self.results_text.see(tk.END)
+        finally:
+            self.root.after(100, self._flush_log)
     
+    @staticmethod
+    def _format_created_date(created_date):
+        """Format an ISO creation date for display, once, at load time"""
+        if created_date != 'Unknown':
+            try:
+                return datetime.fromisoformat(created_date).strftime('%Y-%m-%d %H:%M')
+            except ValueError:
+                pass
+        return created_date
+
     def load_saved_configurations(self):
-        """Load all saved boundary configurations from disk"""
+        """Load saved configuration metadata from the SQLite store.
+
+        Only names, descriptions and creation dates are read at startup;
+        full bodies are parsed lazily by _get_configuration when a
+        configuration is actually loaded."""
         try:
-            for settings_file in self.settings_directory.glob("*.json"):
-                try:
-                    with open(settings_file, 'r') as f:
-                        config_data = json.load(f)
-                        # Use the filename (stem) as the key for consistency
-                        config_name = settings_file.stem
-                        # Ensure the config_data has the correct name matching the file
-                        config_data['name'] = config_name
-                        self.saved_configurations[config_name] = config_data
-                except Exception as e:
-                    self.log_message(f"⚠️ Warning: Could not load configuration '{settings_file.name}': {e}")
-            
+            self._migrate_legacy_configurations()
+            self._backfill_config_metadata()
+
+            self.saved_configurations = {
+                name: {
+                    'description': description or '',
+                    'created_date': created or 'Unknown',
+                    'display_date': self._format_created_date(created or 'Unknown'),
+                    'program_count': programs or 0
+                }
+                for name, description, created, programs in self._cfg_db.execute(
+                    "SELECT name, description, created, programs FROM configs")
+            }
+
             if self.saved_configurations:
                 self.log_message(f"📁 Loaded {len(self.saved_configurations)} saved configurations")
         except Exception as e:
-            self.log_message(f"⚠️ Warning: Could not access settings directory: {e}")
+            self.log_message(f"⚠️ Warning: Could not load saved configurations: {e}")
+
+    def _backfill_config_metadata(self):
+        """One-time fill of the metadata columns for rows saved before they existed"""
+        rows = self._cfg_db.execute(
+            "SELECT name, data FROM configs WHERE description IS NULL OR programs IS NULL"
+        ).fetchall()
+        for name, data in rows:
+            try:
+                body = _json_loads(data)
+            except Exception:
+                continue
+            self._cfg_db.execute(
+                "UPDATE configs SET description = ?, created = ?, programs = ? WHERE name = ?",
+                (body.get('description', ''), body.get('created_date', ''),
+                 len(body.get('program_boundaries', {})), name)
+            )
+        if rows:
+            self._cfg_db.commit()
+
+    def _get_configuration(self, config_name):
+        """Return a configuration's full body, parsing and caching on first use"""
+        body = self._config_bodies.get(config_name)
+        if body is None:
+            row = self._cfg_db.execute(
+                "SELECT data FROM configs WHERE name = ?", (config_name,)
+            ).fetchone()
+            if row is None:
+                raise KeyError(f"No saved configuration named '{config_name}'")
+            body = _json_loads(row[0])
+            self._config_bodies[config_name] = body
+        return body
+
+    def _migrate_legacy_configurations(self):
+        """One-time import of old per-configuration JSON files into SQLite"""
+        for settings_file in self.settings_directory.glob("*.json"):
+            # cache_*.json files are boundary-analysis caches, not configurations
+            if settings_file.name.startswith("cache_"):
+                continue
+            try:
+                config_data = _json_loads(settings_file.read_bytes())
+                # Use the filename (stem) as the key for consistency
+                config_name = settings_file.stem
+                config_data['name'] = config_name
+                self._store_configuration(config_name, config_data)
+                settings_file.unlink()
+                self.log_message(f"📦 Migrated configuration '{config_name}' into the settings database")
+            except Exception as e:
+                self.log_message(f"⚠️ Warning: Could not migrate configuration '{settings_file.name}': {e}")
+
+    def _store_configuration(self, config_name, config_data):
+        """Insert or replace one configuration row in the SQLite store"""
+        self._cfg_db.execute(
+            "INSERT OR REPLACE INTO configs(name, data, mtime, description, created, programs) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (config_name, _json_dumps(config_data), int(time.time()),
+             config_data.get('description', ''), config_data.get('created_date', ''),
+             len(config_data.get('program_boundaries', {})))
+        )
+        self._cfg_db.commit()
+        self._config_bodies[config_name] = config_data
     
     def save_boundary_configuration(self):
         """Save current boundary configuration with a user-defined name"""
         
-        # Check if we have boundaries to save
-        if not any(b["start"] is not None or b["stop"] is not None for b in self.program_boundaries.values()):
+        # Check if we have boundaries to save (vectorized over the array)
+        if not (self._boundaries >= 0).any():
             messagebox.showwarning("Warning", "No boundary data to save. Please load and analyze data first.")
             return
         
@@ -2039,17 +2623,24 @@ For additional assistance, contact your system administrator."""
                     "name": config_name,
                     "description": description_var.get().strip(),
                     "created_date": datetime.now().isoformat(),
-                    "program_boundaries": dict(self.program_boundaries),
-                    "program_mappings": dict(self.program_name_mappings)
+                    # The boundaries property already builds a fresh dict on
+                    # every access, and serialization snapshots the mappings,
+                    # so no defensive copies are needed here
+                    "program_boundaries": self.program_boundaries,
+                    "program_mappings": self.program_name_mappings
                 }
                 
-                # Save to file
-                config_file = self.settings_directory / f"{config_name}.json"
-                with open(config_file, 'w') as f:
-                    json.dump(config_data, f, indent=2)
-                
-                # Update in-memory configurations
-                self.saved_configurations[config_name] = config_data
+                # Save to the settings database
+                self._store_configuration(config_name, config_data)
+
+                # Update the in-memory listing metadata
+                self.saved_configurations[config_name] = {
+                    'description': config_data.get('description', ''),
+                    'created_date': config_data.get('created_date', 'Unknown'),
+                    'display_date': self._format_created_date(
+                        config_data.get('created_date', 'Unknown')),
+                    'program_count': len(config_data.get('program_boundaries', {}))
+                }
                 
                 self.log_message(f"✅ Configuration '{config_name}' saved successfully")
                 messagebox.showinfo("Success", f"Configuration '{config_name}' has been saved.")
@@ -2115,16 +2706,13 @@ For additional assistance, contact your system administrator."""
         v_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         h_scroll.pack(side=tk.BOTTOM, fill=tk.X)
         
-        # Populate the list
+        # Populate the list with columns hidden so the batch insert costs
+        # one redraw instead of one per row
+        config_tree['displaycolumns'] = ()
         for name, config in self.saved_configurations.items():
-            description = config.get('description', '')
-            created_date = config.get('created_date', 'Unknown')
-            if created_date != 'Unknown':
-                try:
-                    created_date = datetime.fromisoformat(created_date).strftime('%Y-%m-%d %H:%M')
-                except:
-                    pass
-            config_tree.insert('', tk.END, values=(name, description, created_date))
+            config_tree.insert('', tk.END, values=(
+                name, config.get('description', ''), config.get('display_date', 'Unknown')))
+        config_tree['displaycolumns'] = '#all'
         
         def load_selected():
             selection = config_tree.selection()
@@ -2138,27 +2726,24 @@ For additional assistance, contact your system administrator."""
                 f"Load configuration '{config_name}'?\nThis will replace current boundary settings."):
                 
                 try:
-                    config_data = self.saved_configurations[config_name]
-                    
-                    # Load boundaries with proper deep copy
-                    self.program_boundaries = copy.deepcopy(config_data['program_boundaries'])
+                    # Bodies are loaded lazily - this is the first (cached)
+                    # parse of the configuration's JSON
+                    config_data = self._get_configuration(config_name)
+
+                    # Load boundaries with a fresh copy so edits never touch the saved config
+                    self.program_boundaries = self._clone_boundaries(config_data['program_boundaries'])
                     
                     # Debug logging
                     self.log_message(f"🔄 Loading configuration '{config_name}'...")
                     non_null_boundaries = {k: v for k, v in self.program_boundaries.items() if v.get('start') is not None or v.get('stop') is not None}
                     self.log_message(f"📊 Loaded {len(non_null_boundaries)} programs with boundary data")
                     
-                    # Update display
+                    # Update display and button states; Tk repaints both on
+                    # the next trip through the event loop, so no forced
+                    # update()/update_idletasks() pass is needed here
                     self.update_boundaries_display()
-                    
-                    # Force complete GUI refresh and update button states
-                    self.root.update_idletasks()
                     self.update_button_states()
-                    
-                    # Additional force refresh for the tree view
-                    if hasattr(self, 'boundaries_tree'):
-                        self.boundaries_tree.update()
-                    
+
                     self.log_message(f"✅ Configuration '{config_name}' loaded successfully")
                     messagebox.showinfo("Success", f"Configuration '{config_name}' has been loaded.")
                     dialog.destroy()
@@ -2182,7 +2767,7 @@ For additional assistance, contact your system administrator."""
     def export_boundary_settings(self):
         """Export boundary settings to a JSON file"""
         
-        if not any(b["start"] is not None or b["stop"] is not None for b in self.program_boundaries.values()):
+        if not (self._boundaries >= 0).any():
             messagebox.showwarning("Warning", "No boundary data to export. Please load and analyze data first.")
             return
         
@@ -2196,8 +2781,8 @@ For additional assistance, contact your system administrator."""
             try:
                 export_data = {
                     "exported_date": datetime.now().isoformat(),
-                    "program_boundaries": dict(self.program_boundaries),
-                    "program_mappings": dict(self.program_name_mappings),
+                    "program_boundaries": self.program_boundaries,
+                    "program_mappings": self.program_name_mappings,
                     "export_info": {
                         "version": "1.0",
                         "source": "ADA Audit GUI",
@@ -2205,8 +2790,8 @@ For additional assistance, contact your system administrator."""
                     }
                 }
                 
-                with open(filename, 'w') as f:
-                    json.dump(export_data, f, indent=2)
+                with open(filename, 'wb', buffering=1 << 20) as f:
+                    f.write(_json_dumps_pretty(export_data))
                 
                 self.log_message(f"✅ Boundary settings exported to: {filename}")
                 messagebox.showinfo("Success", f"Settings exported successfully to:\n{filename}")
@@ -2225,8 +2810,8 @@ For additional assistance, contact your system administrator."""
         
         if filename:
             try:
-                with open(filename, 'r') as f:
-                    import_data = json.load(f)
+                # One read_bytes + one parse; picks up orjson when installed
+                import_data = _json_loads(Path(filename).read_bytes())
                 
                 # Validate the import data structure
                 if 'program_boundaries' not in import_data:
@@ -2242,6 +2827,7 @@ For additional assistance, contact your system administrator."""
                     # Update program mappings if available
                     if 'program_mappings' in import_data:
                         self.program_name_mappings = import_data['program_mappings']
+                        self._rebuild_mapping_indexes()
                     
                     # Update display
                     self.update_boundaries_display()
@@ -2249,7 +2835,8 @@ For additional assistance, contact your system administrator."""
                     self.log_message(f"✅ Boundary settings imported from: {filename}")
                     messagebox.showinfo("Success", "Settings imported successfully!")
                 
-            except json.JSONDecodeError:
+            except ValueError:
+                # Covers json.JSONDecodeError and orjson.JSONDecodeError
                 messagebox.showerror("Error", "Invalid JSON file format.")
             except Exception as e:
                 self.log_message(f"❌ Error importing settings: {e}")
@@ -2301,22 +2888,18 @@ For additional assistance, contact your system administrator."""
         v_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         
         def refresh_list():
-            # Clear existing items
-            for item in manage_tree.get_children():
-                manage_tree.delete(item)
-            
-            # Populate with current configurations
+            # Clear existing items in one Tcl call
+            manage_tree.delete(*manage_tree.get_children())
+
+            # Populate with current configurations, columns hidden during
+            # the batch insert so the tree redraws once at the end
+            manage_tree['displaycolumns'] = ()
             for name, config in self.saved_configurations.items():
-                description = config.get('description', '')
-                created_date = config.get('created_date', 'Unknown')
-                if created_date != 'Unknown':
-                    try:
-                        created_date = datetime.fromisoformat(created_date).strftime('%Y-%m-%d %H:%M')
-                    except:
-                        pass
-                
-                program_count = len(config.get('program_boundaries', {}))
-                manage_tree.insert('', tk.END, values=(name, description, created_date, program_count))
+                manage_tree.insert('', tk.END, values=(
+                    name, config.get('description', ''),
+                    config.get('display_date', 'Unknown'),
+                    config.get('program_count', 0)))
+            manage_tree['displaycolumns'] = '#all'
         
         def delete_selected():
             selection = manage_tree.selection()
@@ -2330,13 +2913,13 @@ For additional assistance, contact your system administrator."""
                 f"Are you sure you want to delete configuration '{config_name}'?\nThis action cannot be undone."):
                 
                 try:
-                    # Remove from disk
-                    config_file = self.settings_directory / f"{config_name}.json"
-                    if config_file.exists():
-                        config_file.unlink()
-                    
+                    # Remove from the settings database
+                    self._cfg_db.execute("DELETE FROM configs WHERE name = ?", (config_name,))
+                    self._cfg_db.commit()
+
                     # Remove from memory
                     del self.saved_configurations[config_name]
+                    self._config_bodies.pop(config_name, None)
                     
                     refresh_list()
                     self.log_message(f"✅ Configuration '{config_name}' deleted successfully")
@@ -12,6 +12,8 @@ from prettytable import PrettyTable
 import tkinter as tk
 from tkinter import messagebox, filedialog, simpledialog
 
+from ADA_Audit_25_26_IMPROVED import load_student_attendance_data
+
 
 def find_row_with_value(df, target_value):
     """
@@ -191,8 +193,10 @@ def run_ada_dashboard_with_boundaries(input_file_path, program_boundaries, progr
         
         log(f"📄 Reading data from: {os.path.basename(input_file_path)}")
         
-        # Read the Excel file
-        df = pd.read_excel(input_file_path, header=None)
+        # Read the Excel file through the shared streaming loader (calamine
+        # when installed, otherwise openpyxl read-only) instead of the full
+        # openpyxl object model behind pd.read_excel
+        df = load_student_attendance_data(input_file_path)
         update_progress(20)
         
         # Convert GUI boundaries to the format expected by dashboard functions
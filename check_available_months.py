@@ -1,40 +1,48 @@
+import io
+import os
+import sys
+
+import numpy as np
 import pandas as pd
-from pathlib import Path
+
+from ADA_Audit_25_26_IMPROVED import (
+    find_rows_for_all_months,
+    load_student_attendance_data,
+)
 
 
 def find_most_recent_attendance_file():
     """Find the most recent PrintMonthlyAttendanceSummaryTotals file in Downloads"""
-    downloads_dir = Path("C:\\Users\\Shawn\\Downloads")
-    
-    if not downloads_dir.exists():
-        return None
-    
-    # Find all attendance summary files
-    attendance_files = list(downloads_dir.glob("PrintMonthlyAttendanceSummaryTotals_*.xlsx"))
-    
-    if not attendance_files:
+    downloads_dir = "C:\\Users\\Shawn\\Downloads"
+
+    # os.scandir returns directory entries with a cached stat, so one
+    # directory read finds the newest file without a stat call per entry
+    most_recent_path = None
+    most_recent_mtime = -1.0
+    try:
+        with os.scandir(downloads_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if (name.startswith("PrintMonthlyAttendanceSummaryTotals_")
+                        and name.endswith(".xlsx")):
+                    mtime = entry.stat().st_mtime
+                    if mtime > most_recent_mtime:
+                        most_recent_mtime = mtime
+                        most_recent_path = entry.path
+    except OSError:
         return None
-    
-    # Get the most recent file by modification time
-    most_recent = max(attendance_files, key=lambda f: f.stat().st_mtime)
-    return str(most_recent)
+
+    return most_recent_path
 
 
 def find_rows_containing_month_number(student_data, month_number_to_find):
     """Find all rows that contain a specific month number in Column C."""
-    matching_row_numbers = []
-    
-    for row_index, cell_value in enumerate(student_data.iloc[:, 2], start=1):
-        if pd.isna(cell_value):
-            continue
-        
-        try:
-            if int(cell_value) == month_number_to_find:
-                matching_row_numbers.append(row_index)
-        except ValueError:
-            continue
-    
-    return matching_row_numbers
+    # One vectorized pass: coerce Column C to numbers (non-numbers become
+    # NaN, which never compares equal) and let NumPy find the matches in C
+    # instead of calling pd.isna/int() per cell
+    col_c = pd.to_numeric(student_data.iloc[:, 2], errors='coerce').to_numpy()
+    matching_rows = np.flatnonzero(col_c == month_number_to_find) + 1
+    return matching_rows.tolist()
 
 
 def check_available_months():
@@ -66,77 +74,90 @@ def check_available_months():
     print(f"\n📊 Loading data from:")
     print(f"   {input_attendance_file}")
     
-    student_attendance_data = pd.read_excel(input_attendance_file, header=None)
+    # Shared loader: calamine engine when installed, otherwise openpyxl in
+    # read-only, values-only streaming mode instead of a full pd.read_excel
+    student_attendance_data = load_student_attendance_data(input_attendance_file)
     
     print(f"   ✅ Loaded {len(student_attendance_data)} rows")
     
+    # Buffer the report and emit it with one stdout write at the end,
+    # instead of paying a flush per print line
+    report = io.StringIO()
+
     # =================================================================
     # Check each month from 1 to 12
     # =================================================================
-    print("\n🔍 Scanning Column C for month numbers 1-12...")
-    print("-" * 60)
+    print("\n🔍 Scanning Column C for month numbers 1-12...", file=report)
+    print("-" * 60, file=report)
     
+    # One shared-kernel pass over Column C buckets every row by month,
+    # the same code path the GUI and the consolidation script use
+    buckets = find_rows_for_all_months(student_attendance_data)
+
     available_months = []
     unavailable_months = []
     month_row_details = {}
-    
+
     for month_number in range(1, 13):
-        rows_with_this_month = find_rows_containing_month_number(student_attendance_data, month_number)
-        
+        rows_with_this_month = buckets[month_number]
+
         if len(rows_with_this_month) > 0:
             available_months.append(month_number)
             month_row_details[month_number] = rows_with_this_month
-            print(f"  ✅ Month {month_number:2d}: Found in {len(rows_with_this_month):3d} rows - {rows_with_this_month[:5]}{'...' if len(rows_with_this_month) > 5 else ''}")
+            print(f"  ✅ Month {month_number:2d}: Found in {len(rows_with_this_month):3d} rows - {rows_with_this_month[:5]}{'...' if len(rows_with_this_month) > 5 else ''}", file=report)
         else:
             unavailable_months.append(month_number)
-            print(f"  ❌ Month {month_number:2d}: NOT FOUND (0 rows)")
+            print(f"  ❌ Month {month_number:2d}: NOT FOUND (0 rows)", file=report)
     
     # =================================================================
     # Summary
     # =================================================================
-    print("\n" + "=" * 60)
-    print("📊 SUMMARY")
-    print("=" * 60)
+    print("\n" + "=" * 60, file=report)
+    print("📊 SUMMARY", file=report)
+    print("=" * 60, file=report)
     
-    print(f"\n✅ AVAILABLE MONTHS ({len(available_months)} months):")
-    print(f"   {available_months}")
+    print(f"\n✅ AVAILABLE MONTHS ({len(available_months)} months):", file=report)
+    print(f"   {available_months}", file=report)
     
     if unavailable_months:
-        print(f"\n❌ UNAVAILABLE MONTHS ({len(unavailable_months)} months):")
-        print(f"   {unavailable_months}")
-        print(f"\n⚠️  WARNING: These months should NOT be processed!")
-        print(f"   The consolidation script should skip these months entirely.")
-    
-    print("\n" + "=" * 60)
-    print("💡 RECOMMENDATION")
-    print("=" * 60)
-    print("\nThe consolidation script should:")
-    print(f"  1. Only loop through: {available_months}")
-    print(f"  2. Skip months: {unavailable_months}")
-    print(f"  3. This prevents adding fake '0' values for non-existent months")
+        print(f"\n❌ UNAVAILABLE MONTHS ({len(unavailable_months)} months):", file=report)
+        print(f"   {unavailable_months}", file=report)
+        print(f"\n⚠️  WARNING: These months should NOT be processed!", file=report)
+        print(f"   The consolidation script should skip these months entirely.", file=report)
+    
+    print("\n" + "=" * 60, file=report)
+    print("💡 RECOMMENDATION", file=report)
+    print("=" * 60, file=report)
+    print("\nThe consolidation script should:", file=report)
+    print(f"  1. Only loop through: {available_months}", file=report)
+    print(f"  2. Skip months: {unavailable_months}", file=report)
+    print(f"  3. This prevents adding fake '0' values for non-existent months", file=report)
     
     # =================================================================
     # Detailed breakdown by month
     # =================================================================
-    print("\n" + "=" * 60)
-    print("📋 DETAILED MONTH BREAKDOWN")
-    print("=" * 60)
+    print("\n" + "=" * 60, file=report)
+    print("📋 DETAILED MONTH BREAKDOWN", file=report)
+    print("=" * 60, file=report)
     
     for month_number in available_months:
         rows = month_row_details[month_number]
-        print(f"\n📅 Month {month_number}:")
-        print(f"   Total rows: {len(rows)}")
-        print(f"   Row numbers: {rows}")
+        print(f"\n📅 Month {month_number}:", file=report)
+        print(f"   Total rows: {len(rows)}", file=report)
+        print(f"   Row numbers: {rows}", file=report)
         
         # Show sample data from first row
         if rows:
             first_row = rows[0]
-            print(f"\n   Sample from Row {first_row}:")
-            print(f"     Column B (Program): {student_attendance_data.iloc[first_row - 1, 1]}")
-            print(f"     Column C (Month):   {student_attendance_data.iloc[first_row - 1, 2]}")
-            print(f"     Column E (Age):     {student_attendance_data.iloc[first_row - 1, 4]}")
-            print(f"     Column AJ (Value):  {student_attendance_data.iloc[first_row - 1, 35]}")
-    
+            print(f"\n   Sample from Row {first_row}:", file=report)
+            print(f"     Column B (Program): {student_attendance_data.iloc[first_row - 1, 1]}", file=report)
+            print(f"     Column C (Month):   {student_attendance_data.iloc[first_row - 1, 2]}", file=report)
+            print(f"     Column E (Age):     {student_attendance_data.iloc[first_row - 1, 4]}", file=report)
+            print(f"     Column AJ (Value):  {student_attendance_data.iloc[first_row - 1, 35]}", file=report)
+    
+    sys.stdout.write(report.getvalue())
+    sys.stdout.flush()
+
     return available_months, unavailable_months, month_row_details
 
 
@@ -1,6 +1,17 @@
+import os
+import sys
+
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
+from ADA_Audit_25_26_IMPROVED import (
+    build_consolidation_tensor,
+    find_rows_for_all_months,
+    load_student_attendance_data,
+    scan_all_boundaries,
+)
+
 
 # =============================================================================
 # UTILITY FUNCTIONS FOR FILE DETECTION
@@ -8,20 +19,26 @@ from pathlib import Path
 
 def find_most_recent_attendance_file():
     """Find the most recent PrintMonthlyAttendanceSummaryTotals file in Downloads"""
-    downloads_dir = Path("C:\\Users\\Shawn\\Downloads")
-    
-    if not downloads_dir.exists():
-        return None
-    
-    # Find all attendance summary files
-    attendance_files = list(downloads_dir.glob("PrintMonthlyAttendanceSummaryTotals_*.xlsx"))
-    
-    if not attendance_files:
+    downloads_dir = "C:\\Users\\Shawn\\Downloads"
+
+    # os.scandir returns directory entries with a cached stat, so one
+    # directory read finds the newest file without a stat call per entry
+    most_recent_path = None
+    most_recent_mtime = -1.0
+    try:
+        with os.scandir(downloads_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if (name.startswith("PrintMonthlyAttendanceSummaryTotals_")
+                        and name.endswith(".xlsx")):
+                    mtime = entry.stat().st_mtime
+                    if mtime > most_recent_mtime:
+                        most_recent_mtime = mtime
+                        most_recent_path = entry.path
+    except OSError:
         return None
-    
-    # Get the most recent file by modification time
-    most_recent = max(attendance_files, key=lambda f: f.stat().st_mtime)
-    return str(most_recent)
+
+    return most_recent_path
 
 
 # =============================================================================
@@ -30,30 +47,21 @@ def find_most_recent_attendance_file():
 
 def find_rows_containing_program_name(student_data, program_name_to_find):
     """Find all rows that contain a specific program name."""
-    matching_row_numbers = []
-    
-    for row_index, cell_value in enumerate(student_data.iloc[:, 1], start=1):
-        if cell_value == program_name_to_find:
-            matching_row_numbers.append(row_index)
-    
-    return matching_row_numbers
+    # Same idea as the month search below: compare the whole Column B at
+    # once in NumPy instead of looping cell by cell in Python
+    col_b = student_data.iloc[:, 1].to_numpy()
+    matching_rows = np.flatnonzero(col_b == program_name_to_find) + 1
+    return matching_rows.tolist()
 
 
 def find_rows_containing_month_number(student_data, month_number_to_find):
     """Find all rows that contain a specific month number."""
-    matching_row_numbers = []
-    
-    for row_index, cell_value in enumerate(student_data.iloc[:, 2], start=1):
-        if pd.isna(cell_value):
-            continue
-        
-        try:
-            if int(cell_value) == month_number_to_find:
-                matching_row_numbers.append(row_index)
-        except ValueError:
-            continue
-    
-    return matching_row_numbers
+    # One vectorized pass: coerce Column C to numbers (non-numbers become
+    # NaN, which never compares equal) and let NumPy find the matches in C
+    # instead of calling pd.isna/int() per cell
+    col_c = pd.to_numeric(student_data.iloc[:, 2], errors='coerce').to_numpy()
+    matching_rows = np.flatnonzero(col_c == month_number_to_find) + 1
+    return matching_rows.tolist()
 
 
 def find_program_boundary_rows(list_of_row_numbers):
@@ -174,22 +182,18 @@ def print_ada_consolidation_fixed():
     # STEP 3: Load the attendance data from Excel
     # =================================================================
     print("\n📊 Loading student attendance data from Excel...")
-    student_attendance_data = pd.read_excel(input_attendance_file, header=None)
+    # Shared loader: calamine engine when installed, otherwise openpyxl in
+    # read-only, values-only streaming mode instead of a full pd.read_excel
+    student_attendance_data = load_student_attendance_data(input_attendance_file)
     
     # =================================================================
     # STEP 4: Find where each program's data starts and ends
     # =================================================================
     print("🔍 Locating program boundaries in the data...")
     
-    program_boundaries = {}
-    for short_code in program_name_mappings.values():
-        program_boundaries[short_code] = {"start": None, "stop": None}
-    
-    for full_program_name, short_code in program_name_mappings.items():
-        matching_rows = find_rows_containing_program_name(student_attendance_data, full_program_name)
-        start_row, end_row = find_program_boundary_rows(matching_rows)
-        program_boundaries[short_code]["start"] = start_row
-        program_boundaries[short_code]["stop"] = end_row
+    # One vectorized isin() pass over Column B finds every program's first
+    # and last row, instead of rescanning the sheet once per program
+    program_boundaries = scan_all_boundaries(student_attendance_data, program_name_mappings)
     
     # =================================================================
     # STEP 5: Adjust boundaries to prevent overlaps
@@ -229,8 +233,19 @@ def print_ada_consolidation_fixed():
         stop = boundaries.get("stop", "Not found") 
         print(f"  {program_code}: Start Row {start}, End Row {stop}")
     
+    # Batch runs can accept the detected boundaries as-is with --yes or
+    # ADA_NONINTERACTIVE=1, skipping the twelve per-program prompts
+    non_interactive = "--yes" in sys.argv[1:] or os.environ.get("ADA_NONINTERACTIVE")
+    if non_interactive:
+        missing = [code for code, bounds in program_boundaries.items()
+                   if bounds["start"] is None or bounds["stop"] is None]
+        if missing:
+            print(f"\n⚠️  Accepting boundaries without verification; not found: {missing}")
+        else:
+            print("\n✅ Accepting detected boundaries without verification (--yes)")
+
     # Allow user to verify and correct boundaries if needed
-    for program_code in program_boundaries.keys():
+    for program_code in (() if non_interactive else program_boundaries.keys()):
         user_response = input(
             f"\n❓ Are the boundaries for {program_code} correct? (yes/no): "
         ).lower().strip()
@@ -277,10 +292,14 @@ def print_ada_consolidation_fixed():
     
     monthly_attendance_by_program = {}
     available_months = []
-    
+
+    # One shared-kernel pass over Column C buckets every row by month,
+    # instead of twelve separate scans
+    rows_by_month = find_rows_for_all_months(student_attendance_data)
+
     for month_number in range(1, 13):
-        rows_with_this_month = find_rows_containing_month_number(student_attendance_data, month_number)
-        
+        rows_with_this_month = rows_by_month[month_number]
+
         if len(rows_with_this_month) > 0:
             monthly_attendance_by_program[month_number] = rows_with_this_month
             available_months.append(month_number)
@@ -310,45 +329,37 @@ def print_ada_consolidation_fixed():
     print("🔄 CONSOLIDATED ATTENDANCE DATA (ONLY AVAILABLE MONTHS)")
     print("=" * 80)
     
-    # FIXED: Only generate keys for months that actually exist in the data
-    all_keys = []
-    for parent_program in program_consolidation_rules.keys():
-        for month in available_months:  # ✅ ONLY loop through available months
-            for age_group in ["TK-3", "4-6", "7-8", "9-12"]:
-                field_pattern = f"{parent_program}_Month_{month}_{age_group}: "
-                all_keys.append(field_pattern)
-    
-    # Process and print each value
-    for field_pattern in all_keys:
-        # Extract parent program from field pattern
-        parent_program = field_pattern.split('_Month_')[0]
-        
-        # Get consolidation rules for this program
-        child_programs = program_consolidation_rules.get(parent_program, [parent_program])
-        
-        # Extract month and age group
-        parts = field_pattern.replace(": ", "").split("_")
-        month_idx = parts.index("Month") + 1
-        month = parts[month_idx]
-        age_group = "_".join(parts[month_idx + 1:])
-        
-        # Sum up values from all child programs
-        total_value = 0
-        component_strings = []
-        
-        for child_program in child_programs:
-            child_field_pattern = f"{child_program}_Month_{month}_{age_group}: "
-            child_value = raw_attendance_data.get(child_field_pattern, 0)
-            
-            if child_value and not pd.isna(child_value) and child_value != 0:
-                total_value += child_value
-                component_strings.append(f"{child_program}: {child_value}")
-        
-        # Print in the requested format
-        if total_value > 0:
-            components = " + ".join(component_strings) if component_strings else "0"
-            print(f"{field_pattern} = {components} = {total_value}")
-    
+    # FIXED: Only process months that actually exist in the data
+    age_groups = ["TK-3", "4-6", "7-8", "9-12"]
+
+    # Shared kernel: child tensor plus membership-matrix contraction
+    parent_programs, child_index, raw, consolidated = build_consolidation_tensor(
+        raw_attendance_data, program_consolidation_rules, available_months, age_groups)
+
+    # Collect the report lines and emit them with one print at the end,
+    # instead of one write per nonzero value
+    report_lines = []
+    for parent_position, parent_program in enumerate(parent_programs):
+        child_programs = program_consolidation_rules[parent_program]
+        parent_totals = consolidated[parent_position]
+
+        for month_position, month in enumerate(available_months):
+            for age_position, age_group in enumerate(age_groups):
+                total_value = parent_totals[month_position, age_position]
+
+                # Report in the requested format
+                if total_value > 0:
+                    component_strings = [
+                        f"{child_program}: {raw[child_index[child_program], month_position, age_position]:g}"
+                        for child_program in child_programs
+                        if raw[child_index[child_program], month_position, age_position]
+                    ]
+                    components = " + ".join(component_strings) if component_strings else "0"
+                    report_lines.append(
+                        f"{parent_program}_Month_{month}_{age_group}:  = {components} = {total_value:g}")
+
+    if report_lines:
+        print("\n".join(report_lines))
     print("=" * 80)
     print("✅ Consolidation complete!")
     print(f"📍 Configuration: {location}, {school_year}, {school_name}")
@@ -1,12 +1,12 @@
 """
 Test script to display all program attendance values
 """
-import pandas as pd
 from ADA_Audit_25_26_IMPROVED import (
-    find_rows_containing_program_name,
-    find_rows_containing_month_number,
-    find_program_boundary_rows,
-    extract_student_attendance_data
+    build_consolidation_tensor,
+    find_rows_for_all_months,
+    extract_student_attendance_data,
+    load_student_attendance_data,
+    scan_all_boundaries
 )
 
 # File path
@@ -48,19 +48,13 @@ print("=" * 80)
 
 # Load data
 print("\n📂 Loading attendance data...")
-student_attendance_data = pd.read_excel(input_attendance_file, header=None)
+# Shared loader: calamine engine when installed, otherwise openpyxl in
+# read-only, values-only streaming mode instead of a full pd.read_excel
+student_attendance_data = load_student_attendance_data(input_attendance_file)
 
-# Find program boundaries
+# Find program boundaries in one vectorized pass over Column B
 print("🔍 Finding program boundaries...")
-program_boundaries = {}
-for short_code in program_name_mappings.values():
-    program_boundaries[short_code] = {"start": None, "stop": None}
-
-for full_program_name, short_code in program_name_mappings.items():
-    matching_rows = find_rows_containing_program_name(student_attendance_data, full_program_name)
-    start_row, end_row = find_program_boundary_rows(matching_rows)
-    program_boundaries[short_code]["start"] = start_row
-    program_boundaries[short_code]["stop"] = end_row
+program_boundaries = scan_all_boundaries(student_attendance_data, program_name_mappings)
 
 # Adjust boundaries
 prog_C_tk_start = program_boundaries["Prog_C_TK"]["start"]
@@ -87,12 +81,9 @@ for i in range(len(programs_to_adjust) - 1):
     if current_start is not None and next_start is not None:
         program_boundaries[current_program]["stop"] = next_start - 1
 
-# Find month occurrences
+# Find month occurrences with one pass over Column C
 print("📅 Finding month occurrences...")
-monthly_attendance_by_program = {}
-for month_number in range(1, 13):
-    rows_with_this_month = find_rows_containing_month_number(student_attendance_data, month_number)
-    monthly_attendance_by_program[month_number] = rows_with_this_month
+monthly_attendance_by_program = find_rows_for_all_months(student_attendance_data)
 
 # Extract raw data
 print("📈 Extracting raw attendance data...")
@@ -104,22 +95,20 @@ raw_attendance_data = extract_student_attendance_data(
 
 # Consolidate data
 print("🔄 Consolidating data...")
-consolidated_attendance_data = {}
-
-for parent_program, child_programs in program_consolidation_rules.items():
-    for month in range(1, 13):
-        for age_group in ["TK-3", "4-6", "7-8", "9-12"]:
-            field_pattern = f"{parent_program}_Month_{month}_{age_group}: "
-            total_value = 0
-            
-            for child_program in child_programs:
-                child_field_pattern = f"{child_program}_Month_{month}_{age_group}: "
-                child_value = raw_attendance_data.get(child_field_pattern, 0)
-                
-                if child_value and not pd.isna(child_value) and child_value != 0:
-                    total_value += child_value
-            
-            consolidated_attendance_data[field_pattern] = total_value
+age_groups = ["TK-3", "4-6", "7-8", "9-12"]
+months = range(1, 13)
+
+# Shared kernel: child tensor plus membership-matrix contraction
+parent_programs, child_index, raw, consolidated = build_consolidation_tensor(
+    raw_attendance_data, program_consolidation_rules, months, age_groups)
+
+consolidated_attendance_data = {
+    f"{parent_program}_Month_{month}_{age_group}: ":
+        consolidated[parent_position, month_position, age_position]
+    for parent_position, parent_program in enumerate(parent_programs)
+    for month_position, month in enumerate(months)
+    for age_position, age_group in enumerate(age_groups)
+}
 
 # Display all values
 print("\n" + "=" * 80)
@@ -130,22 +119,27 @@ print("=" * 80)
 programs = ["Prog_C", "Prog_C_TK", "Prog_N", "Prog_N_TK", "Prog_J", "Prog_J_TK", "Prog_K", "Prog_K_TK"]
 age_groups = ["TK-3", "4-6", "7-8", "9-12"]
 
+# Collect the display lines and emit them with one print, instead of a
+# write per value
+display_lines = []
 for program in programs:
-    print(f"\n{'='*80}")
-    print(f"🎯 {program}")
-    print(f"{'='*80}")
-    
+    display_lines.append(f"\n{'='*80}")
+    display_lines.append(f"🎯 {program}")
+    display_lines.append(f"{'='*80}")
+
     for month in range(1, 13):
-        print(f"\n  📅 Month {month}:")
+        display_lines.append(f"\n  📅 Month {month}:")
         for age_group in age_groups:
             field_name = f"{program}_Month_{month}_{age_group}: "
             value = consolidated_attendance_data.get(field_name, 0)
-            
+
             # Highlight the specific example requested
             if field_name == "Prog_J_Month_11_7-8: ":
-                print(f"    ⭐ {field_name} = {value} ⭐")
+                display_lines.append(f"    ⭐ {field_name} = {value} ⭐")
             else:
-                print(f"    {field_name} = {value}")
+                display_lines.append(f"    {field_name} = {value}")
+
+print("\n".join(display_lines))
 
 # Display summary statistics
 print("\n" + "=" * 80)
@@ -160,7 +154,9 @@ for program in programs:
         for age_group in age_groups:
             field_name = f"{program}_Month_{month}_{age_group}: "
             value = consolidated_attendance_data.get(field_name, 0)
-            if value and not pd.isna(value) and value != 0:
+            # Consolidated values come from the NaN-normalized tensor, so a
+            # plain truthiness check is enough
+            if value:
                 total += value
                 non_zero_count += 1
     